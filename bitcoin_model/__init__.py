@@ -5,15 +5,35 @@ A sophisticated Python framework for strategic Bitcoin investment decisions
 based on macroeconomic indicators, on-chain metrics, and monetary policy analysis.
 """
 
-from .core import BitcoinMacroModel
-from .models.fed_pivot import FedPivotModel
-from .models.m2_miner import M2MinerModel
+import importlib
+
+# Public classes are imported on first access (PEP 562) so that importing the
+# package, or only its config/utils, doesn't pull in pandas and the HTTP stack
+_LAZY_IMPORTS = {
+    "BitcoinMacroModel": ".core",
+    "SignalResult": ".core",
+    "FedPivotModel": ".models.fed_pivot",
+    "M2MinerModel": ".models.m2_miner",
+    "ScenarioResult": ".models.base",
+}
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
 
 __version__ = "3.0.0"
 __author__ = "SBSHCMG"
 
 __all__ = [
     "BitcoinMacroModel",
+    "SignalResult",
     "FedPivotModel", 
-    "M2MinerModel"
+    "M2MinerModel",
+    "ScenarioResult"
 ]
\ No newline at end of file
@@ -3,78 +3,135 @@ Configuration settings for the Bitcoin Strategic Investment Model
 """
 
 import os
-from typing import Dict, Any
+import functools
+import numbers
+from types import MappingProxyType
+from typing import Dict, Any, Union
+import numpy as np
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# Static configuration is built once at import time and shared read-only
+# across all Settings instances (and threads)
+
+# Risk profiles with position sizing parameters
+_POSITION_LIMITS = MappingProxyType({
+    'conservative': MappingProxyType({
+        'base': 0.03,  # 3%
+        'max': 0.10    # 10%
+    }),
+    'moderate': MappingProxyType({
+        'base': 0.05,  # 5%
+        'max': 0.15    # 15%
+    }),
+    'aggressive': MappingProxyType({
+        'base': 0.10,  # 10%
+        'max': 0.25    # 25%
+    })
+})
+
+_DEFAULT_POSITION_LIMITS = _POSITION_LIMITS['moderate']
+
+# API rate limits (requests per minute unless noted)
+_RATE_LIMITS = MappingProxyType({
+    'fred': None,  # No limits
+    'coingecko_free': 50,  # per minute
+    'glassnode_advanced': 20,  # per minute
+    'cryptoquant_professional': 3000  # per day
+})
+
+# Signal thresholds for each scenario
+_SIGNAL_THRESHOLDS = MappingProxyType({
+    'scenario_1': 0.70,  # Fed Pivot + Exchange Reserves
+    'scenario_2': 0.75   # M2 + Miner Capitulation
+})
+
+# Signal thresholds indexed directly by scenario number
+_SCENARIO_THRESHOLDS = (None, _SIGNAL_THRESHOLDS['scenario_1'], _SIGNAL_THRESHOLDS['scenario_2'])
+_DEFAULT_SIGNAL_THRESHOLD = 0.7
+
+# Exchange reserve thresholds (in BTC)
+_EXCHANGE_RESERVE_THRESHOLDS = MappingProxyType({
+    'critical_low': 2.35e6,
+    'low': 2.5e6,
+    'high': 2.8e6,
+    'critical_high': 3.0e6
+})
+
+# M2 growth thresholds
+_M2_THRESHOLDS = MappingProxyType({
+    'extreme_expansion': 0.15,  # 15%+
+    'strong_expansion': 0.10,   # 10%+
+    'normal_expansion': 0.05,   # 5%+
+    'contraction': 0.0          # Below 0%
+})
+
+# Fed funds rate thresholds
+_FED_RATE_THRESHOLDS = MappingProxyType({
+    'ultra_low': 1.0,   # Below 1%
+    'low': 3.0,         # Below 3%
+    'neutral': 5.0,     # Below 5%
+    'high': 5.0         # Above 5%
+})
+
+# Combined signal score lower bounds for each strength level
+_SIGNAL_STRENGTH_LEVELS = MappingProxyType({
+    'moderate': 0.4,
+    'strong': 0.6,
+    'very_strong': 0.8
+})
+
+# NUPL (Net Unrealized Profit/Loss) levels
+_NUPL_LEVELS = MappingProxyType({
+    'capitulation': 0.0,
+    'accumulation': 0.25,
+    'optimism': 0.5,
+    'belief': 0.75,
+    'euphoria': 1.0
+})
+
+def _frozen_array(values) -> np.ndarray:
+    """Build a read-only NumPy array"""
+    array = np.array(values)
+    array.flags.writeable = False
+    return array
+
+# Sorted threshold arrays for O(log k) classification via np.searchsorted
+_RESERVE_LOWER = _frozen_array([_EXCHANGE_RESERVE_THRESHOLDS['critical_low'],
+                                _EXCHANGE_RESERVE_THRESHOLDS['low']])
+_RESERVE_UPPER = _frozen_array([_EXCHANGE_RESERVE_THRESHOLDS['high'],
+                                _EXCHANGE_RESERVE_THRESHOLDS['critical_high']])
+_RESERVE_LABELS = _frozen_array(['critical_low', 'low', 'normal', 'high', 'critical_high'])
+
+_M2_SORTED = _frozen_array([_M2_THRESHOLDS['contraction'], _M2_THRESHOLDS['normal_expansion'],
+                            _M2_THRESHOLDS['strong_expansion'], _M2_THRESHOLDS['extreme_expansion']])
+_M2_LABELS = _frozen_array(['contraction', 'slow_growth', 'normal_expansion',
+                            'strong_expansion', 'extreme_expansion'])
+
+_FED_RATE_SORTED = _frozen_array([_FED_RATE_THRESHOLDS['ultra_low'], _FED_RATE_THRESHOLDS['low'],
+                                  _FED_RATE_THRESHOLDS['neutral']])
+_FED_RATE_LABELS = _frozen_array(['ultra_low', 'low', 'neutral', 'high'])
+
+_SIGNAL_STRENGTH_SORTED = _frozen_array(list(_SIGNAL_STRENGTH_LEVELS.values()))
+_SIGNAL_STRENGTH_LABELS = _frozen_array(['weak'] + list(_SIGNAL_STRENGTH_LEVELS.keys()))
+
+_NUPL_SORTED = _frozen_array(list(_NUPL_LEVELS.values()))
+_NUPL_LABELS = _frozen_array(list(_NUPL_LEVELS.keys()))
+
 class Settings:
     """Configuration settings loaded from environment variables"""
     
+    POSITION_LIMITS = _POSITION_LIMITS
+    RATE_LIMITS = _RATE_LIMITS
+    SIGNAL_THRESHOLDS = _SIGNAL_THRESHOLDS
+    EXCHANGE_RESERVE_THRESHOLDS = _EXCHANGE_RESERVE_THRESHOLDS
+    M2_THRESHOLDS = _M2_THRESHOLDS
+    FED_RATE_THRESHOLDS = _FED_RATE_THRESHOLDS
+    SIGNAL_STRENGTH_LEVELS = _SIGNAL_STRENGTH_LEVELS
+    NUPL_LEVELS = _NUPL_LEVELS
+    
     def __init__(self):
-        # Risk profiles with position sizing parameters
-        self.POSITION_LIMITS = {
-            'conservative': {
-                'base': 0.03,  # 3%
-                'max': 0.10    # 10%
-            },
-            'moderate': {
-                'base': 0.05,  # 5%
-                'max': 0.15    # 15%
-            },
-            'aggressive': {
-                'base': 0.10,  # 10%
-                'max': 0.25    # 25%
-            }
-        }
-        
-        # API rate limits (requests per minute unless noted)
-        self.RATE_LIMITS = {
-            'fred': None,  # No limits
-            'coingecko_free': 50,  # per minute
-            'glassnode_advanced': 20,  # per minute
-            'cryptoquant_professional': 3000  # per day
-        }
-        
-        # Signal thresholds for each scenario
-        self.SIGNAL_THRESHOLDS = {
-            'scenario_1': 0.70,  # Fed Pivot + Exchange Reserves
-            'scenario_2': 0.75   # M2 + Miner Capitulation
-        }
-        
-        # Exchange reserve thresholds (in BTC)
-        self.EXCHANGE_RESERVE_THRESHOLDS = {
-            'critical_low': 2.35e6,
-            'low': 2.5e6,
-            'high': 2.8e6,
-            'critical_high': 3.0e6
-        }
-        
-        # M2 growth thresholds
-        self.M2_THRESHOLDS = {
-            'extreme_expansion': 0.15,  # 15%+
-            'strong_expansion': 0.10,   # 10%+
-            'normal_expansion': 0.05,   # 5%+
-            'contraction': 0.0          # Below 0%
-        }
-        
-        # Fed funds rate thresholds
-        self.FED_RATE_THRESHOLDS = {
-            'ultra_low': 1.0,   # Below 1%
-            'low': 3.0,         # Below 3%
-            'neutral': 5.0,     # Below 5%
-            'high': 5.0         # Above 5%
-        }
-        
-        # NUPL (Net Unrealized Profit/Loss) levels
-        self.NUPL_LEVELS = {
-            'capitulation': 0.0,
-            'accumulation': 0.25,
-            'optimism': 0.5,
-            'belief': 0.75,
-            'euphoria': 1.0
-        }
-        
         # Default configuration from environment
         self.DEFAULT_PORTFOLIO_VALUE = float(os.getenv('DEFAULT_PORTFOLIO_VALUE', 100000))
         self.RISK_PROFILE = os.getenv('RISK_PROFILE', 'moderate')
@@ -82,16 +139,54 @@ class Settings:
         self.DRY_RUN = os.getenv('DRY_RUN', 'true').lower() == 'true'
         self.LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
         self.LOG_FILE = os.getenv('LOG_FILE', 'bitcoin_model.log')
-        
+    
     def get_position_limits(self, risk_profile: str = None) -> Dict[str, float]:
-        """Get position limits for given risk profile"""
-        profile = risk_profile or self.RISK_PROFILE
-        return self.POSITION_LIMITS.get(profile, self.POSITION_LIMITS['moderate'])
+        """Get position limits for given risk profile (shared read-only mapping)"""
+        return _POSITION_LIMITS.get(risk_profile or self.RISK_PROFILE, _DEFAULT_POSITION_LIMITS)
     
     def get_signal_threshold(self, scenario: int) -> float:
-        """Get signal threshold for scenario"""
-        key = f'scenario_{scenario}'
-        return self.SIGNAL_THRESHOLDS.get(key, 0.7)
+        """Get signal threshold for scenario (unknown scenarios get the default)"""
+        if isinstance(scenario, numbers.Integral) and 0 < scenario < len(_SCENARIO_THRESHOLDS):
+            return _SCENARIO_THRESHOLDS[scenario]
+        return _DEFAULT_SIGNAL_THRESHOLD
+    
+    @staticmethod
+    def _label(labels: np.ndarray, index, value):
+        """Return a plain str for scalar lookups and a label array for batches"""
+        result = labels[index]
+        return result if np.ndim(value) else str(result)
+    
+    def classify_exchange_reserves(self, reserves: Union[float, np.ndarray]):
+        """
+        Classify exchange reserves into a reserve level
+        
+        Values below 'critical_low'/'low' fall into those levels, values above
+        'critical_high'/'high' into those, and anything in between is 'normal'.
+        """
+        index = (np.searchsorted(_RESERVE_LOWER, reserves, side='right') +
+                 np.searchsorted(_RESERVE_UPPER, reserves, side='left'))
+        return self._label(_RESERVE_LABELS, index, reserves)
+    
+    def classify_m2_growth(self, growth_rate: Union[float, np.ndarray]):
+        """Classify M2 YoY growth rate into a growth level"""
+        index = np.searchsorted(_M2_SORTED, growth_rate, side='right')
+        return self._label(_M2_LABELS, index, growth_rate)
+    
+    def classify_fed_rate(self, rate: Union[float, np.ndarray]):
+        """Classify the Fed funds rate into a rate level"""
+        index = np.searchsorted(_FED_RATE_SORTED, rate, side='right')
+        return self._label(_FED_RATE_LABELS, index, rate)
+    
+    def classify_signal_strength(self, score: Union[float, np.ndarray]):
+        """Classify a combined signal score into a strength level"""
+        index = np.searchsorted(_SIGNAL_STRENGTH_SORTED, score, side='right')
+        return self._label(_SIGNAL_STRENGTH_LABELS, index, score)
+    
+    def classify_nupl(self, nupl: Union[float, np.ndarray]):
+        """Classify NUPL into a market phase (each level is the phase's upper bound)"""
+        index = np.minimum(np.searchsorted(_NUPL_SORTED, nupl, side='left'),
+                           len(_NUPL_LABELS) - 1)
+        return self._label(_NUPL_LABELS, index, nupl)
     
     def validate_config(self) -> Dict[str, Any]:
         """Validate configuration and return status"""
@@ -106,4 +201,9 @@ class Settings:
         return {
             'valid': len(issues) == 0,
             'issues': issues
-        }
\ No newline at end of file
+        }
+
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the shared Settings instance (environment is read once)"""
+    return Settings()
@@ -3,17 +3,49 @@ Core BitcoinMacroModel class that orchestrates the different scenario models
 """
 
 import os
+import time
+import asyncio
 import logging
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from typing import Dict, Any, Optional
 from datetime import datetime
 from dotenv import load_dotenv
 
 from .models.fed_pivot import FedPivotModel
 from .models.m2_miner import M2MinerModel
-from .config.settings import Settings
+from .data_providers.fred_client import FREDClient
+from .data_providers.crypto_data import DataProviderFactory
+from .config.settings import get_settings
+from .utils.time_utils import now_iso
 
 load_dotenv()
 
+# Ceiling in seconds for a full health check across all scenarios
+HEALTH_CHECK_TIMEOUT = 5.0
+
+@dataclass(frozen=True)
+class SignalResult:
+    """Typed view of the fields traders read from a scenario analysis result"""
+    
+    __slots__ = ('buy_signal', 'combined_score', 'scenario_name', 'trade_plan')
+    
+    buy_signal: bool
+    combined_score: float
+    scenario_name: str
+    trade_plan: Dict[str, Any]
+    
+    @classmethod
+    def from_result(cls, result: Dict[str, Any]) -> 'SignalResult':
+        """Unpack an analysis result dictionary once"""
+        signals = result.get('signals', {})
+        return cls(
+            buy_signal=bool(signals.get('buy_signal', False)),
+            combined_score=signals.get('combined_score', 0.0),
+            scenario_name=result.get('scenario_name', 'Unknown'),
+            trade_plan=result.get('trade_plan', {})
+        )
+
 class BitcoinMacroModel:
     """
     Main class for Bitcoin Strategic Investment Model
@@ -42,11 +74,22 @@ class BitcoinMacroModel:
             }
         
         self.api_keys = api_keys
-        self.settings = Settings()
+        self.settings = get_settings()
+        
+        # Data providers are shared by all scenarios, so a series fetched for one
+        # scenario is a cache hit for the next
+        self.fred_client = FREDClient(api_keys.get('fred'))
+        self.crypto_provider = DataProviderFactory.create_crypto_provider(api_keys)
+        self.onchain_provider = DataProviderFactory.create_onchain_provider(api_keys)
+        providers = {
+            'fred_client': self.fred_client,
+            'crypto_provider': self.crypto_provider,
+            'onchain_provider': self.onchain_provider
+        }
         
         # Initialize scenario models
-        self.fed_pivot_model = FedPivotModel(api_keys)
-        self.m2_miner_model = M2MinerModel(api_keys)
+        self.fed_pivot_model = FedPivotModel(api_keys, **providers)
+        self.m2_miner_model = M2MinerModel(api_keys, **providers)
         
         # Available scenarios
         self.scenarios = {
@@ -54,6 +97,9 @@ class BitcoinMacroModel:
             2: self.m2_miner_model
         }
         
+        # Result keys for each scenario, built once rather than per call
+        self.scenario_names = {scenario_id: f'scenario_{scenario_id}' for scenario_id in self.scenarios}
+        
         self.logger.info("BitcoinMacroModel initialized with scenarios: %s", 
                         list(self.scenarios.keys()))
     
@@ -85,7 +131,7 @@ class BitcoinMacroModel:
             
             # Add metadata
             result['scenario'] = scenario
-            result['timestamp'] = datetime.now().isoformat()
+            result['timestamp'] = now_iso()
             result['portfolio_value'] = portfolio_value
             
             self.logger.info(f"Analysis complete for scenario {scenario}. "
@@ -109,16 +155,23 @@ class BitcoinMacroModel:
         """
         results = {}
         
-        for scenario_id in self.scenarios:
-            try:
-                result = self.run_analysis(scenario_id, portfolio_value)
-                results[f'scenario_{scenario_id}'] = result
-            except Exception as e:
-                self.logger.error(f"Failed to get signals for scenario {scenario_id}: {str(e)}")
-                results[f'scenario_{scenario_id}'] = {
-                    'error': str(e),
-                    'signals': {'buy_signal': False, 'combined_score': 0.0}
-                }
+        # Scenario analyses are independent and I/O bound, so run them concurrently
+        with ThreadPoolExecutor(max_workers=len(self.scenarios)) as executor:
+            futures = {
+                scenario_id: executor.submit(self.run_analysis, scenario_id, portfolio_value)
+                for scenario_id in self.scenarios
+            }
+            
+            for scenario_id, future in futures.items():
+                name = self.scenario_names[scenario_id]
+                try:
+                    results[name] = future.result()
+                except Exception as e:
+                    self.logger.error(f"Failed to get signals for scenario {scenario_id}: {str(e)}")
+                    results[name] = {
+                        'error': str(e),
+                        'signals': {'buy_signal': False, 'combined_score': 0.0}
+                    }
         
         return results
     
@@ -153,33 +206,111 @@ class BitcoinMacroModel:
         
         return strongest
     
-    def health_check(self) -> Dict[str, Any]:
+    def get_strongest_signal_result(self, portfolio_value: float = 100000) -> SignalResult:
         """
-        Check the health of all data providers and models
+        Get the strongest signal across all scenarios as a SignalResult
         
+        Args:
+            portfolio_value: Total portfolio value for position sizing
+            
         Returns:
-            Dictionary with health status of each component
+            SignalResult for the strongest signal
         """
-        health = {
-            'timestamp': datetime.now().isoformat(),
+        return SignalResult.from_result(self.get_strongest_signal(portfolio_value))
+    
+    def _new_health_report(self) -> Dict[str, Any]:
+        """Create an empty health report"""
+        return {
+            'timestamp': now_iso(),
             'overall_status': 'healthy',
             'components': {}
         }
+    
+    def _record_component_health(self, health: Dict[str, Any], scenario_id: int,
+                                 outcome: Any, timeout: float):
+        """
+        Record one scenario's health check outcome in the report
+        
+        Args:
+            health: Health report being built
+            scenario_id: Scenario the outcome belongs to
+            outcome: Model health dictionary, or the exception raised while checking
+            timeout: Timeout that applied, for reporting
+        """
+        component = self.scenario_names[scenario_id]
+        
+        if isinstance(outcome, (FutureTimeoutError, asyncio.TimeoutError)):
+            self.logger.warning(f"Health check for scenario {scenario_id} timed out after {timeout}s")
+            health['components'][component] = {
+                'status': 'timeout',
+                'error': f'Health check exceeded {timeout}s'
+            }
+            health['overall_status'] = 'degraded'
+        elif isinstance(outcome, Exception):
+            health['components'][component] = {
+                'status': 'error',
+                'error': str(outcome)
+            }
+            health['overall_status'] = 'error'
+        else:
+            health['components'][component] = outcome
+            
+            if outcome.get('status') != 'healthy':
+                health['overall_status'] = 'degraded'
+    
+    def health_check(self, timeout: float = HEALTH_CHECK_TIMEOUT) -> Dict[str, Any]:
+        """
+        Check the health of all data providers and models
+        
+        Args:
+            timeout: Maximum seconds to wait for all scenario checks
+            
+        Returns:
+            Dictionary with health status of each component
+        """
+        health = self._new_health_report()
+        
+        # Check each scenario model concurrently under a shared deadline
+        executor = ThreadPoolExecutor(max_workers=len(self.scenarios))
+        try:
+            futures = {
+                scenario_id: executor.submit(model.health_check)
+                for scenario_id, model in self.scenarios.items()
+            }
+            deadline = time.monotonic() + timeout
+            
+            for scenario_id, future in futures.items():
+                try:
+                    outcome = future.result(timeout=max(0.0, deadline - time.monotonic()))
+                except Exception as e:
+                    outcome = e
+                self._record_component_health(health, scenario_id, outcome, timeout)
+        finally:
+            # Don't block on checks that overran the deadline
+            executor.shutdown(wait=False)
+        
+        return health
+    
+    async def health_check_async(self, timeout: float = HEALTH_CHECK_TIMEOUT) -> Dict[str, Any]:
+        """
+        Check the health of all data providers and models from an event loop
+        
+        Args:
+            timeout: Maximum seconds to wait for each scenario check
+            
+        Returns:
+            Dictionary with health status of each component
+        """
+        health = self._new_health_report()
+        loop = asyncio.get_running_loop()
+        
+        outcomes = await asyncio.gather(
+            *[asyncio.wait_for(loop.run_in_executor(None, model.health_check), timeout)
+              for model in self.scenarios.values()],
+            return_exceptions=True
+        )
         
-        # Check each scenario model
-        for scenario_id, model in self.scenarios.items():
-            try:
-                model_health = model.health_check()
-                health['components'][f'scenario_{scenario_id}'] = model_health
-                
-                if model_health.get('status') != 'healthy':
-                    health['overall_status'] = 'degraded'
-                    
-            except Exception as e:
-                health['components'][f'scenario_{scenario_id}'] = {
-                    'status': 'error',
-                    'error': str(e)
-                }
-                health['overall_status'] = 'error'
+        for scenario_id, outcome in zip(self.scenarios, outcomes):
+            self._record_component_health(health, scenario_id, outcome, timeout)
         
         return health
\ No newline at end of file
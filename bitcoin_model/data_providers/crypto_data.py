@@ -3,11 +3,12 @@ Cryptocurrency and Bitcoin on-chain data providers
 """
 
 import logging
+import orjson
 import requests
-import pandas as pd
-from datetime import datetime, timedelta
 from typing import Optional, Dict, Any, List
-import time
+
+from .http_session import AsyncSessionMixin, get_shared_session, RateLimiter, TTLCache, DEFAULT_TIMEOUT
+from ..utils.time_utils import now_iso
 
 class CryptoDataProvider:
     """Base class for crypto data providers"""
@@ -20,16 +21,45 @@ class CryptoDataProvider:
         """Check provider health"""
         return {'status': 'unknown', 'provider': self.__class__.__name__}
 
-class CoinGeckoClient(CryptoDataProvider):
+class CoinGeckoClient(AsyncSessionMixin, CryptoDataProvider):
     """CoinGecko API client for basic crypto data"""
     
+    # Query for the lightweight coins/markets endpoint
+    MARKET_DATA_PARAMS = {
+        'ids': 'bitcoin',
+        'vs_currency': 'usd',
+        'sparkline': 'false',
+        'price_change_percentage': '24h,7d,30d'
+    }
+    
+    # (exposed field, coins/markets field) pairs; the endpoint returns flat USD values
+    MARKET_DATA_FIELDS = (
+        ('price_usd', 'current_price'),
+        ('market_cap', 'market_cap'),
+        ('volume_24h', 'total_volume'),
+        ('price_change_24h', 'price_change_percentage_24h'),
+        ('price_change_7d', 'price_change_percentage_7d_in_currency'),
+        ('price_change_30d', 'price_change_percentage_30d_in_currency'),
+        ('market_cap_rank', 'market_cap_rank'),
+        ('circulating_supply', 'circulating_supply'),
+        ('total_supply', 'total_supply'),
+        ('max_supply', 'max_supply')
+    )
+    
     def __init__(self, api_key: Optional[str] = None):
         super().__init__(api_key)
         self.base_url = "https://api.coingecko.com/api/v3"
-        self.rate_limit_delay = 1.2  # seconds between requests for free tier
+        self.rate_limiter = RateLimiter(max_calls=30, period=60.0)  # free tier budget
+        self.timeout = DEFAULT_TIMEOUT
+        
+        # Shared persistent session reuses DNS lookups and TCP/TLS connections
+        self._session = get_shared_session()
+        
+        # Market data is reused briefly so price lookups and health checks don't re-fetch
+        self._cache = TTLCache(ttl=60)
     
-    def _make_request(self, endpoint: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Make request to CoinGecko API"""
+    def _prepare_request(self, endpoint: str, params: Optional[Dict[str, Any]]):
+        """Add credentials to params and build the URL and cache key"""
         if params is None:
             params = {}
         
@@ -37,54 +67,92 @@ class CoinGeckoClient(CryptoDataProvider):
             params['x_cg_demo_api_key'] = self.api_key
         
         url = f"{self.base_url}/{endpoint}"
+        cache_key = (endpoint, frozenset(params.items()))
+        return url, params, cache_key
+    
+    def _make_request(self, endpoint: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Make request to CoinGecko API"""
+        url, params, cache_key = self._prepare_request(endpoint, params)
+        
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        # Rate limiting for free tier (429 Retry-After is honored by the session)
+        if not self.api_key:
+            self.rate_limiter.acquire()
         
         try:
-            response = requests.get(url, params=params)
+            response = self._session.get(url, params=params, timeout=self.timeout)
             response.raise_for_status()
             
-            # Rate limiting for free tier
-            if not self.api_key:
-                time.sleep(self.rate_limit_delay)
-            
-            return response.json()
+            data = orjson.loads(response.content)
+            self._cache.set(cache_key, data)
+            return data
         except requests.exceptions.RequestException as e:
             self.logger.error(f"CoinGecko API request failed: {str(e)}")
             raise
     
+    async def _amake_request(self, endpoint: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Make request to CoinGecko API without blocking the event loop"""
+        url, params, cache_key = self._prepare_request(endpoint, params)
+        
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        if not self.api_key:
+            await self.rate_limiter.acquire_async()
+        
+        import aiohttp
+        
+        session = await self._get_async_session()
+        
+        try:
+            async with session.get(url, params=params) as response:
+                response.raise_for_status()
+                data = orjson.loads(await response.read())
+            self._cache.set(cache_key, data)
+            return data
+        except aiohttp.ClientError as e:
+            self.logger.error(f"CoinGecko API request failed: {str(e)}")
+            raise
+    
     def get_bitcoin_price(self) -> Optional[float]:
         """Get current Bitcoin price in USD"""
-        try:
-            data = self._make_request('simple/price', {
-                'ids': 'bitcoin',
-                'vs_currencies': 'usd'
-            })
-            return data.get('bitcoin', {}).get('usd')
-        except Exception as e:
-            self.logger.error(f"Failed to get Bitcoin price: {str(e)}")
-            return None
+        return self.get_bitcoin_market_data().get('price_usd')
+    
+    def _parse_market_data(self, data: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Map a coins/markets response to the market data fields we expose"""
+        if not data:
+            self.logger.warning("No market data returned for bitcoin")
+            return {}
+        
+        coin = data[0]
+        return {field: coin.get(source) for field, source in self.MARKET_DATA_FIELDS}
     
     def get_bitcoin_market_data(self) -> Dict[str, Any]:
         """Get comprehensive Bitcoin market data"""
         try:
-            data = self._make_request('coins/bitcoin')
-            market_data = data.get('market_data', {})
-            
-            return {
-                'price_usd': market_data.get('current_price', {}).get('usd'),
-                'market_cap': market_data.get('market_cap', {}).get('usd'),
-                'volume_24h': market_data.get('total_volume', {}).get('usd'),
-                'price_change_24h': market_data.get('price_change_percentage_24h'),
-                'price_change_7d': market_data.get('price_change_percentage_7d'),
-                'price_change_30d': market_data.get('price_change_percentage_30d'),
-                'market_cap_rank': data.get('market_cap_rank'),
-                'circulating_supply': market_data.get('circulating_supply'),
-                'total_supply': market_data.get('total_supply'),
-                'max_supply': market_data.get('max_supply')
-            }
+            data = self._make_request('coins/markets', dict(self.MARKET_DATA_PARAMS))
+            return self._parse_market_data(data)
         except Exception as e:
             self.logger.error(f"Failed to get Bitcoin market data: {str(e)}")
             return {}
     
+    async def aget_bitcoin_market_data(self) -> Dict[str, Any]:
+        """Async variant of get_bitcoin_market_data"""
+        try:
+            data = await self._amake_request('coins/markets', dict(self.MARKET_DATA_PARAMS))
+            return self._parse_market_data(data)
+        except Exception as e:
+            self.logger.error(f"Failed to get Bitcoin market data: {str(e)}")
+            return {}
+    
+    async def aget_bitcoin_price(self) -> Optional[float]:
+        """Async variant of get_bitcoin_price"""
+        return (await self.aget_bitcoin_market_data()).get('price_usd')
+    
     def health_check(self) -> Dict[str, Any]:
         """Check CoinGecko API health"""
         try:
@@ -93,14 +161,14 @@ class CoinGeckoClient(CryptoDataProvider):
                 'status': 'healthy' if price is not None else 'degraded',
                 'provider': 'CoinGecko',
                 'btc_price': price,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': now_iso()
             }
         except Exception as e:
             return {
                 'status': 'error',
                 'provider': 'CoinGecko',
                 'error': str(e),
-                'timestamp': datetime.now().isoformat()
+                'timestamp': now_iso()
             }
 
 class MockOnChainDataProvider(CryptoDataProvider):
@@ -174,7 +242,7 @@ class MockOnChainDataProvider(CryptoDataProvider):
             'lth_supply_percentage': self.get_long_term_holder_supply(),
             'nupl': self.get_nupl(),
             'hash_ribbon': self.get_hash_ribbon_signal(),
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': now_iso(),
             'data_source': 'mock'  # Indicates this is mock data
         }
     
@@ -186,7 +254,7 @@ class MockOnChainDataProvider(CryptoDataProvider):
                 'status': 'healthy',
                 'provider': 'MockOnChainData',
                 'exchange_reserves': metrics['exchange_reserves'],
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': metrics['timestamp'],
                 'warning': 'Using mock data - replace with actual API integration'
             }
         except Exception as e:
@@ -194,7 +262,7 @@ class MockOnChainDataProvider(CryptoDataProvider):
                 'status': 'error',
                 'provider': 'MockOnChainData',
                 'error': str(e),
-                'timestamp': datetime.now().isoformat()
+                'timestamp': now_iso()
             }
 
 class DataProviderFactory:
@@ -2,16 +2,69 @@
 Federal Reserve Economic Data (FRED) API client
 """
 
+import functools
 import logging
+import orjson
 import requests
-import pandas as pd
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+import numpy as np
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Dict, Any, List, Callable, TYPE_CHECKING
 import time
+from concurrent.futures import ThreadPoolExecutor
 
-class FREDClient:
+from .http_session import AsyncSessionMixin, get_shared_session, TTLCache, DEFAULT_TIMEOUT
+from ..utils.time_utils import now_iso
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+def _pandas():
+    """Import pandas on first use; it is only needed for DataFrame results"""
+    import pandas
+    return pandas
+
+def memoize_by_date(period: str = 'day',
+                    should_cache: Callable[[Any], bool] = lambda result: result is not None):
+    """
+    Memoize a FREDClient method for the current UTC day or month
+    
+    Results are stored per instance and keyed on the method arguments plus the
+    date bucket, so they are recomputed once the underlying series can have
+    published a new observation.
+    
+    Args:
+        period: 'day' for daily series, 'month' for monthly series
+        should_cache: Predicate deciding whether a result may be memoized
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            today = datetime.now(timezone.utc).date()
+            bucket = (today.year, today.month) if period == 'month' else today
+            key = (func.__name__, args, tuple(sorted(kwargs.items())))
+            
+            cached = self._memo.get(key)
+            if cached is not None and cached[0] == bucket:
+                return cached[1]
+            
+            result = func(self, *args, **kwargs)
+            if should_cache(result):
+                self._memo[key] = (bucket, result)
+            return result
+        
+        return wrapper
+    return decorator
+
+class FREDClient(AsyncSessionMixin):
     """Client for accessing Federal Reserve Economic Data"""
     
+    # Window of daily Fed funds data shared by current-rate and pivot lookups
+    FED_FUNDS_LOOKBACK_DAYS = 180
+    
+    # Window of monthly M2 data shared by the growth rate and the M2 scenario's
+    # acceleration, so both are served by one cached fetch
+    M2_LOOKBACK_MONTHS = 18
+    
     def __init__(self, api_key: str):
         """
         Initialize FRED client
@@ -21,39 +74,72 @@ class FREDClient:
         """
         self.api_key = api_key
         self.base_url = "https://api.stlouisfed.org/fred"
+        self.timeout = DEFAULT_TIMEOUT
         self.logger = logging.getLogger(__name__)
         
-    def _make_request(self, endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
-        """Make request to FRED API"""
+        # Shared persistent session reuses DNS lookups and TCP/TLS connections
+        self._session = get_shared_session()
+        
+        # FRED series update at most daily, so responses can be reused for an hour
+        self._cache = TTLCache(ttl=3600)
+        self._series_cache = TTLCache(ttl=3600)
+        self._memo = {}
+        
+    def _prepare_request(self, endpoint: str, params: Dict[str, Any]):
+        """Add credentials to params and build the URL and cache key"""
         params['api_key'] = self.api_key
         params['file_type'] = 'json'
         
         url = f"{self.base_url}/{endpoint}"
+        cache_key = (endpoint, frozenset(params.items()))
+        return url, cache_key
+    
+    def _make_request(self, endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Make request to FRED API"""
+        url, cache_key = self._prepare_request(endpoint, params)
+        
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
         
         try:
-            response = requests.get(url, params=params)
+            response = self._session.get(url, params=params, timeout=self.timeout)
             response.raise_for_status()
-            return response.json()
+            data = orjson.loads(response.content)
+            self._cache.set(cache_key, data)
+            return data
         except requests.exceptions.RequestException as e:
             self.logger.error(f"FRED API request failed: {str(e)}")
             raise
     
-    def get_series(self, series_id: str, 
-                   start_date: Optional[str] = None,
-                   end_date: Optional[str] = None,
-                   limit: int = 1000) -> pd.DataFrame:
-        """
-        Get time series data from FRED
+    async def _amake_request(self, endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Make request to FRED API without blocking the event loop"""
+        url, cache_key = self._prepare_request(endpoint, params)
         
-        Args:
-            series_id: FRED series ID (e.g., 'DFF' for Fed Funds Rate)
-            start_date: Start date in YYYY-MM-DD format
-            end_date: End date in YYYY-MM-DD format
-            limit: Maximum number of observations
-            
-        Returns:
-            DataFrame with date and value columns
-        """
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        import aiohttp
+        
+        session = await self._get_async_session()
+        
+        try:
+            async with session.get(url, params=params) as response:
+                response.raise_for_status()
+                data = orjson.loads(await response.read())
+            self._cache.set(cache_key, data)
+            return data
+        except aiohttp.ClientError as e:
+            self.logger.error(f"FRED API request failed: {str(e)}")
+            raise
+    
+    @staticmethod
+    def _observation_params(series_id: str,
+                            start_date: Optional[str] = None,
+                            end_date: Optional[str] = None,
+                            limit: int = 1000) -> Dict[str, Any]:
+        """Build series/observations query params, most recent first"""
         params = {
             'series_id': series_id,
             'limit': limit,
@@ -64,29 +150,191 @@ class FREDClient:
             params['observation_start'] = start_date
         if end_date:
             params['observation_end'] = end_date
-            
-        data = self._make_request('series/observations', params)
         
+        return params
+    
+    def _extract_observations(self, series_id: str, data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Pull the observation list out of a series/observations response"""
         observations = data.get('observations', [])
         
         if not observations:
             self.logger.warning(f"No data found for series {series_id}")
+        
+        return observations
+    
+    def _get_observations(self, series_id: str,
+                          start_date: Optional[str] = None,
+                          end_date: Optional[str] = None,
+                          limit: int = 1000) -> List[Dict[str, Any]]:
+        """Fetch raw series observations from FRED, most recent first"""
+        params = self._observation_params(series_id, start_date, end_date, limit)
+        data = self._make_request('series/observations', params)
+        return self._extract_observations(series_id, data)
+    
+    async def _aget_observations(self, series_id: str,
+                                 start_date: Optional[str] = None,
+                                 end_date: Optional[str] = None,
+                                 limit: int = 1000) -> List[Dict[str, Any]]:
+        """Fetch raw series observations from FRED asynchronously"""
+        params = self._observation_params(series_id, start_date, end_date, limit)
+        data = await self._amake_request('series/observations', params)
+        return self._extract_observations(series_id, data)
+    
+    @staticmethod
+    def _observations_to_frame(observations: List[Dict[str, Any]]) -> 'pd.DataFrame':
+        """Convert descending FRED observations to an ascending date/value frame"""
+        pd = _pandas()
+        
+        if not observations:
             return pd.DataFrame()
         
-        # Convert to DataFrame
-        df = pd.DataFrame(observations)
+        # Convert to DataFrame, keeping only the columns we use
+        df = pd.DataFrame.from_records(observations, columns=['date', 'value'])
         df['date'] = pd.to_datetime(df['date'])
         df['value'] = pd.to_numeric(df['value'], errors='coerce')
         
-        # Remove rows with missing values
-        df = df.dropna(subset=['value'])
+        # Remove rows with missing values and flip the descending response
+        # to ascending date order
+        return df.dropna(subset=['value']).iloc[::-1].reset_index(drop=True)
+    
+    @staticmethod
+    def _observations_to_values(observations: List[Dict[str, Any]]) -> np.ndarray:
+        """Convert descending FRED observations to an ascending read-only float array"""
+        # FRED marks missing observations with '.'
+        values = np.fromiter(
+            (float(obs['value']) for obs in reversed(observations) if obs['value'] != '.'),
+            dtype=np.float64
+        )
+        values.flags.writeable = False
+        return values
+    
+    @staticmethod
+    def _start_date(days_back: int) -> str:
+        """Format the date days_back days ago as YYYY-MM-DD"""
+        return (datetime.now() - timedelta(days=days_back)).strftime('%Y-%m-%d')
+    
+    def get_series(self, series_id: str, 
+                   start_date: Optional[str] = None,
+                   end_date: Optional[str] = None,
+                   limit: int = 1000) -> 'pd.DataFrame':
+        """
+        Get time series data from FRED
         
-        # Sort by date ascending
-        df = df.sort_values('date').reset_index(drop=True)
+        Args:
+            series_id: FRED series ID (e.g., 'DFF' for Fed Funds Rate)
+            start_date: Start date in YYYY-MM-DD format
+            end_date: End date in YYYY-MM-DD format
+            limit: Maximum number of observations
+            
+        Returns:
+            DataFrame with date and value columns
+        """
+        observations = self._get_observations(series_id, start_date, end_date, limit)
+        return self._observations_to_frame(observations)
+    
+    async def aget_series(self, series_id: str,
+                          start_date: Optional[str] = None,
+                          end_date: Optional[str] = None,
+                          limit: int = 1000) -> 'pd.DataFrame':
+        """Async variant of get_series"""
+        observations = await self._aget_observations(series_id, start_date, end_date, limit)
+        return self._observations_to_frame(observations)
+    
+    def get_series_values(self, series_id: str,
+                          start_date: Optional[str] = None,
+                          end_date: Optional[str] = None,
+                          limit: int = 1000) -> np.ndarray:
+        """
+        Get time series values from FRED without building a DataFrame
+        
+        Args:
+            series_id: FRED series ID (e.g., 'DFF' for Fed Funds Rate)
+            start_date: Start date in YYYY-MM-DD format
+            end_date: End date in YYYY-MM-DD format
+            limit: Maximum number of observations
+            
+        Returns:
+            Float array of observation values in ascending date order
+        """
+        # The start date doubles as a daily bucket, so a series is parsed once per day
+        cache_key = (series_id, start_date, end_date, limit)
+        values = self._series_cache.get(cache_key)
+        if values is not None:
+            return values
+        
+        observations = self._get_observations(series_id, start_date, end_date, limit)
+        values = self._observations_to_values(observations)
+        
+        if len(values):
+            self._series_cache.set(cache_key, values)
+        
+        return values
+    
+    async def aget_series_values(self, series_id: str,
+                                 start_date: Optional[str] = None,
+                                 end_date: Optional[str] = None,
+                                 limit: int = 1000) -> np.ndarray:
+        """
+        Async variant of get_series_values
+        
+        Shares the parsed-series cache with the sync API, so awaiting the series
+        an analysis needs up front makes the sync derivations (current rate,
+        M2 growth, pivot detection) cache hits.
+        """
+        cache_key = (series_id, start_date, end_date, limit)
+        values = self._series_cache.get(cache_key)
+        if values is not None:
+            return values
+        
+        observations = await self._aget_observations(series_id, start_date, end_date, limit)
+        values = self._observations_to_values(observations)
+        
+        if len(values):
+            self._series_cache.set(cache_key, values)
+        
+        return values
+    
+    def _fetch_concurrently(self, fetch: Callable, series_ids: List[str],
+                            **kwargs) -> Dict[str, Any]:
+        """Run fetch(series_id, **kwargs) for every series in parallel"""
+        if not series_ids:
+            return {}
+        
+        # FRED has no per-key rate limit, so all series can be requested at once
+        with ThreadPoolExecutor(max_workers=len(series_ids)) as executor:
+            futures = {
+                series_id: executor.submit(fetch, series_id, **kwargs)
+                for series_id in series_ids
+            }
+            return {series_id: future.result() for series_id, future in futures.items()}
+    
+    def get_multi_series(self, series_ids: List[str], **kwargs) -> Dict[str, 'pd.DataFrame']:
+        """
+        Get several FRED series concurrently
         
-        return df[['date', 'value']]
+        Args:
+            series_ids: FRED series IDs to fetch
+            **kwargs: start_date, end_date and limit, applied to every series
+            
+        Returns:
+            Dictionary mapping series ID to its DataFrame
+        """
+        return self._fetch_concurrently(self.get_series, series_ids, **kwargs)
+    
+    def get_multi_series_values(self, series_ids: List[str], **kwargs) -> Dict[str, np.ndarray]:
+        """
+        Get values for several FRED series concurrently
+        
+        Args:
+            series_ids: FRED series IDs to fetch
+            **kwargs: start_date, end_date and limit, applied to every series
+            
+        Returns:
+            Dictionary mapping series ID to its value array
+        """
+        return self._fetch_concurrently(self.get_series_values, series_ids, **kwargs)
     
-    def get_fed_funds_rate(self, days_back: int = 90) -> pd.DataFrame:
+    def get_fed_funds_rate(self, days_back: int = 90) -> 'pd.DataFrame':
         """
         Get Federal Funds Rate data
         
@@ -96,10 +344,9 @@ class FREDClient:
         Returns:
             DataFrame with Fed Funds Rate data
         """
-        start_date = (datetime.now() - timedelta(days=days_back)).strftime('%Y-%m-%d')
-        return self.get_series('DFF', start_date=start_date)
+        return self.get_series('DFF', start_date=self._start_date(days_back))
     
-    def get_m2_money_supply(self, months_back: int = 24) -> pd.DataFrame:
+    def get_m2_money_supply(self, months_back: int = 24) -> 'pd.DataFrame':
         """
         Get M2 Money Supply data
         
@@ -109,8 +356,38 @@ class FREDClient:
         Returns:
             DataFrame with M2 data
         """
-        start_date = (datetime.now() - timedelta(days=months_back*30)).strftime('%Y-%m-%d')
-        return self.get_series('M2SL', start_date=start_date)
+        return self.get_series('M2SL', start_date=self._start_date(months_back*30))
+    
+    def get_m2_values(self, months_back: int = 24) -> np.ndarray:
+        """
+        Get M2 Money Supply values without building a DataFrame
+        
+        Args:
+            months_back: Number of months of historical data
+            
+        Returns:
+            Float array of monthly M2 values in ascending date order
+        """
+        return self.get_series_values('M2SL', start_date=self._start_date(months_back*30))
+    
+    async def aget_m2_values(self, months_back: int = 24) -> np.ndarray:
+        """Async variant of get_m2_values"""
+        return await self.aget_series_values('M2SL', start_date=self._start_date(months_back*30))
+    
+    async def aget_fed_funds_values(self, days_back: int = FED_FUNDS_LOOKBACK_DAYS) -> np.ndarray:
+        """
+        Get daily Fed Funds Rate values asynchronously
+        
+        With the default window this fills the cache the current-rate and pivot
+        lookups read from.
+        
+        Args:
+            days_back: Number of days of historical data
+            
+        Returns:
+            Float array of daily rates in ascending date order
+        """
+        return await self.aget_series_values('DFF', start_date=self._start_date(days_back))
     
     def get_current_fed_rate(self) -> Optional[float]:
         """
@@ -120,14 +397,15 @@ class FREDClient:
             Current Fed Funds Rate or None if unavailable
         """
         try:
-            df = self.get_fed_funds_rate(days_back=30)
-            if not df.empty:
-                return float(df.iloc[-1]['value'])
+            rates = self.get_series_values('DFF', start_date=self._start_date(self.FED_FUNDS_LOOKBACK_DAYS))
+            if len(rates):
+                return float(rates[-1])
         except Exception as e:
             self.logger.error(f"Failed to get current Fed rate: {str(e)}")
         
         return None
     
+    @memoize_by_date(period='month')
     def get_m2_growth_rate(self) -> Optional[float]:
         """
         Get year-over-year M2 growth rate
@@ -136,15 +414,12 @@ class FREDClient:
             M2 YoY growth rate as decimal (e.g., 0.10 for 10%) or None
         """
         try:
-            df = self.get_m2_money_supply(months_back=15)
-            if len(df) < 12:
+            m2 = self.get_m2_values(months_back=self.M2_LOOKBACK_MONTHS)
+            if len(m2) < 13:
                 return None
                 
-            # Calculate YoY growth
-            current_value = df.iloc[-1]['value']
-            year_ago_value = df.iloc[-13]['value']  # Approximately 12 months ago
-            
-            growth_rate = (current_value - year_ago_value) / year_ago_value
+            # Calculate YoY growth (12 monthly observations back)
+            growth_rate = (m2[-1] - m2[-13]) / m2[-13]
             return float(growth_rate)
             
         except Exception as e:
@@ -152,7 +427,9 @@ class FREDClient:
         
         return None
     
-    def detect_fed_pivot(self, lookback_days: int = 180) -> Dict[str, Any]:
+    @memoize_by_date(period='day',
+                     should_cache=lambda result: 'error' not in result and 'reason' not in result)
+    def detect_fed_pivot(self, lookback_days: int = FED_FUNDS_LOOKBACK_DAYS) -> Dict[str, Any]:
         """
         Detect if Fed has pivoted policy direction
         
@@ -163,16 +440,13 @@ class FREDClient:
             Dictionary with pivot information
         """
         try:
-            df = self.get_fed_funds_rate(days_back=lookback_days)
-            if len(df) < 10:
+            rates = self.get_series_values('DFF', start_date=self._start_date(lookback_days))
+            if len(rates) < 10:
                 return {'pivot_detected': False, 'reason': 'Insufficient data'}
             
-            # Get recent rates
-            recent_rates = df.tail(30)['value'].tolist()
-            older_rates = df.head(30)['value'].tolist()
-            
-            recent_avg = sum(recent_rates) / len(recent_rates)
-            older_avg = sum(older_rates) / len(older_rates)
+            # Compare recent and older average rates
+            recent_avg = float(rates[-30:].mean())
+            older_avg = float(rates[:30].mean())
             
             # Detect significant change in direction
             rate_change = recent_avg - older_avg
@@ -181,7 +455,7 @@ class FREDClient:
                 'pivot_detected': abs(rate_change) > 0.5,  # 50bps threshold
                 'direction': 'cutting' if rate_change < -0.25 else 'hiking' if rate_change > 0.25 else 'neutral',
                 'magnitude': abs(rate_change),
-                'current_rate': recent_rates[-1],
+                'current_rate': float(rates[-1]),
                 'trend_change': rate_change
             }
             
@@ -205,11 +479,11 @@ class FREDClient:
             return {
                 'status': 'healthy' if rate is not None else 'degraded',
                 'current_fed_rate': rate,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': now_iso()
             }
         except Exception as e:
             return {
                 'status': 'error',
                 'error': str(e),
-                'timestamp': datetime.now().isoformat()
+                'timestamp': now_iso()
             }
\ No newline at end of file
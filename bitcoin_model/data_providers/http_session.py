@@ -0,0 +1,209 @@
+"""
+Shared HTTP session factory for data provider clients
+"""
+
+import asyncio
+import functools
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any, Hashable, Optional, TYPE_CHECKING
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+if TYPE_CHECKING:
+    import aiohttp
+
+DEFAULT_TIMEOUT = 10  # seconds
+DNS_CACHE_TTL = 300  # seconds to cache resolved hosts in async sessions
+KEEPALIVE_TIMEOUT = 300  # seconds to keep idle async connections open
+
+def create_session(pool_size: int = 10, max_retries: int = 3,
+                   backoff_factor: float = 0.5) -> requests.Session:
+    """
+    Create a pooled HTTP session with keep-alive and retry handling
+    
+    Args:
+        pool_size: Number of connections kept alive per host
+        max_retries: Maximum retries for transient failures
+        backoff_factor: Exponential backoff factor between retries
+        
+    Returns:
+        Configured requests Session
+    """
+    retry = Retry(
+        total=max_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=[429, 502, 503, 504],
+        allowed_methods=['GET']
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size,
+                          pool_maxsize=pool_size,
+                          max_retries=retry)
+    
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+@functools.lru_cache(maxsize=1)
+def get_shared_session() -> requests.Session:
+    """
+    Get the process-wide pooled session
+    
+    Sharing one session across client instances means each API host is
+    resolved and TLS-handshaked once per process rather than once per client.
+    """
+    return create_session()
+
+def create_async_session(limit: int = 10,
+                         timeout: Optional[float] = DEFAULT_TIMEOUT) -> 'aiohttp.ClientSession':
+    """
+    Create a pooled aiohttp session with keep-alive and DNS caching
+    
+    Must be called from a running event loop.
+    
+    Args:
+        limit: Maximum simultaneous connections
+        timeout: Total per-request timeout in seconds, or None for aiohttp's default
+        
+    Returns:
+        Configured aiohttp ClientSession
+    """
+    import aiohttp
+    
+    connector = aiohttp.TCPConnector(limit=limit,
+                                     ttl_dns_cache=DNS_CACHE_TTL,
+                                     keepalive_timeout=KEEPALIVE_TIMEOUT)
+    if timeout is None:
+        return aiohttp.ClientSession(connector=connector)
+    return aiohttp.ClientSession(connector=connector,
+                                 timeout=aiohttp.ClientTimeout(total=timeout))
+
+class AsyncSessionMixin:
+    """
+    Lazily created aiohttp session shared by a client's async methods
+    
+    Clients can be used as async context managers to close the session.
+    """
+    
+    _async_session = None
+    _owns_async_session = True
+    
+    async def _get_async_session(self) -> 'aiohttp.ClientSession':
+        """Get the client's aiohttp session, creating it on first use"""
+        if self._async_session is None or self._async_session.closed:
+            self._async_session = create_async_session()
+            self._owns_async_session = True
+        return self._async_session
+    
+    def use_async_session(self, session: 'aiohttp.ClientSession'):
+        """
+        Use a session owned by the caller, e.g. one shared with an exchange client
+        
+        The caller remains responsible for closing it.
+        """
+        self._async_session = session
+        self._owns_async_session = False
+    
+    async def aclose(self):
+        """Close the aiohttp session if this client opened it"""
+        if (self._owns_async_session and self._async_session is not None and
+                not self._async_session.closed):
+            await self._async_session.close()
+        self._async_session = None
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+class TTLCache:
+    """Thread-safe in-process cache whose entries expire after a fixed TTL"""
+    
+    def __init__(self, ttl: float, maxsize: int = 128):
+        """
+        Initialize the cache
+        
+        Args:
+            ttl: Time-to-live for each entry in seconds
+            maxsize: Maximum number of entries before evicting the oldest
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return None
+            
+            return value
+    
+    def set(self, key: Hashable, value: Any):
+        """Store value under key"""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def clear(self):
+        """Remove all cached entries"""
+        with self._lock:
+            self._entries.clear()
+
+class RateLimiter:
+    """Thread-safe sliding-window rate limiter that only blocks when the budget is spent"""
+    
+    def __init__(self, max_calls: int, period: float = 60.0):
+        """
+        Initialize the rate limiter
+        
+        Args:
+            max_calls: Maximum number of calls allowed per period
+            period: Window length in seconds
+        """
+        self.max_calls = max_calls
+        self.period = period
+        self._calls = deque()
+        self._lock = threading.Lock()
+    
+    def _reserve(self) -> float:
+        """Record a call if the budget allows it, else return seconds to wait"""
+        with self._lock:
+            now = time.monotonic()
+            while self._calls and now - self._calls[0] >= self.period:
+                self._calls.popleft()
+            
+            if len(self._calls) < self.max_calls:
+                self._calls.append(now)
+                return 0.0
+            
+            return self.period - (now - self._calls[0])
+    
+    def acquire(self):
+        """Block until a call is permitted, then record it"""
+        wait = self._reserve()
+        while wait > 0:
+            time.sleep(wait)
+            wait = self._reserve()
+    
+    async def acquire_async(self):
+        """Wait without blocking the event loop until a call is permitted"""
+        wait = self._reserve()
+        while wait > 0:
+            await asyncio.sleep(wait)
+            wait = self._reserve()
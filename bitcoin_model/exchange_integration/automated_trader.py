@@ -4,13 +4,66 @@ Automated trading system for executing BSI model signals
 
 import asyncio
 import logging
-import ccxt
-from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List
+import os
+import random
+import time
+import uuid
+import numpy as np
+import ccxt.async_support as ccxt_async
+import ccxt.pro as ccxt_pro
+from datetime import datetime
+from typing import Dict, Any, Optional, List, Tuple
 import json
 
-from .trading_config import TradingConfig, SafetyManager, OrderType
+from .trading_config import TradingConfig, SafetyManager, OrderType, ExchangeType, AsyncTokenBucket
 from ..core import BitcoinMacroModel
+from ..data_providers.http_session import create_async_session
+
+# Longest wait between trading cycles when nothing wakes the loop (seconds)
+CYCLE_INTERVAL = 60.0
+
+# Minimum interval between routine signal checks (seconds)
+SIGNAL_CHECK_INTERVAL = 15 * 60
+
+# Streamed price move since the last cycle that triggers an early cycle
+PRICE_WAKE_THRESHOLD = 0.01  # 1%
+
+# Retries and base delay (seconds) when the exchange rejects a request for rate limiting
+RATE_LIMIT_RETRIES = 3
+RATE_LIMIT_BACKOFF = 1.0
+
+# On-disk cache of exchange market metadata, reused across restarts while fresh
+MARKETS_CACHE_DIR = os.path.expanduser(os.path.join('~', '.cache', 'bitcoin_model'))
+MARKETS_CACHE_TTL = 6 * 3600  # seconds
+
+def _resolve_exchange_class(exchange_id: str):
+    """CCXT class for an exchange id, preferring the WebSocket-capable ccxt.pro variant"""
+    return getattr(ccxt_pro, exchange_id, None) or getattr(ccxt_async, exchange_id)
+
+# Exchange classes for the supported exchanges, resolved once at import
+_EXCHANGE_CLASSES = {}
+for _exchange in ExchangeType:
+    try:
+        _EXCHANGE_CLASSES[_exchange.value] = _resolve_exchange_class(_exchange.value)
+    except AttributeError:
+        pass
+
+# Exchange errors signalling that requests are being rate limited
+RATE_LIMIT_ERRORS = (ccxt_async.DDoSProtection, ccxt_async.RateLimitExceeded)
+
+# Exchange errors the trading loop backs off from and retries; anything else
+# (e.g. AuthenticationError) stops the trader
+TRANSIENT_EXCHANGE_ERRORS = (ccxt_async.NetworkError, ccxt_async.ExchangeNotAvailable) + RATE_LIMIT_ERRORS
+
+# Errors the cycle helpers pass up to the trading loop instead of falling back
+LOOP_CONTROL_ERRORS = (ccxt_async.AuthenticationError,) + TRANSIENT_EXCHANGE_ERRORS
+
+# CCXT order statuses after which an order can no longer fill
+TERMINAL_ORDER_STATUSES = frozenset({'closed', 'canceled', 'expired', 'rejected'})
+
+# Trading loop backoff after transient errors (seconds)
+LOOP_BACKOFF_BASE = 1.0
+LOOP_BACKOFF_MAX = 300.0
 
 class AutomatedTrader:
     """
@@ -31,7 +84,7 @@ class AutomatedTrader:
         self.logger = logging.getLogger(__name__)
         
         # Validate configuration
-        errors = config.validate()
+        errors = config.validation_errors
         if errors:
             error_msg = "Trading configuration errors: " + "; ".join(errors)
             self.logger.error(error_msg)
@@ -40,34 +93,139 @@ class AutomatedTrader:
         # Initialize exchange
         self.exchange = self._initialize_exchange()
         
+        # Client-side throttle for exchange REST calls
+        self._bucket = AsyncTokenBucket(capacity=config.burst_limit,
+                                        refill_rate=config.requests_per_minute / 60)
+        
+        # Struct-of-arrays position state, one slot per traded symbol
+        self.symbols = config.symbols
+        self.primary_symbol = self.symbols[0]
+        self._symbol_index = {symbol: i for i, symbol in enumerate(self.symbols)}
+        self.positions = np.zeros(len(self.symbols))
+        self.target_positions = np.zeros(len(self.symbols))
+        
         # Trading state
         self.is_running = False
-        self.current_position = 0.0  # Current BTC position size
-        self.last_signal_check = None
-        self.pending_orders = []
+        self.last_signal_check = None  # Wall-clock time of the last check, for reporting
+        self._last_signal_check_mono: Optional[float] = None  # Monotonic time for interval gating
+        self.pending_orders: Dict[str, Dict[str, Any]] = {}  # In-flight orders by client id
+        self._order_tasks: Dict[str, asyncio.Task] = {}  # Submission tasks by client id
+        
+        # Last BTC price as (price, monotonic timestamp); calls within a cycle see the same price
+        self._price_cache: Optional[Tuple[float, float]] = None
+        self._price_ttl = 2.0  # seconds
+        self._ticker_task: Optional[asyncio.Task] = None
+        self._http_session = None  # aiohttp session shared by exchange and price provider
+        
+        # Event-driven wakeups: _wake cuts the cycle wait short, _model_updated
+        # forces a signal check regardless of the routine interval. The event is
+        # created in start() so it belongs to the loop that runs the trader
+        self._wake: Optional[asyncio.Event] = None
+        self._model_updated = False
+        self._cycle_price: Optional[float] = None
         
-        self.logger.info(f"AutomatedTrader initialized for {config.exchange}")
+        self.logger.info("AutomatedTrader initialized for %s", config.exchange)
         if config.dry_run:
             self.logger.warning("DRY RUN MODE - No real trades will be executed")
     
-    def _initialize_exchange(self) -> ccxt.Exchange:
-        """Initialize CCXT exchange instance"""
+    @property
+    def current_position(self) -> float:
+        """Current position size in the primary symbol (BTC)"""
+        return float(self.positions[0])
+    
+    @current_position.setter
+    def current_position(self, value: float):
+        self.positions[0] = value
+    
+    def _initialize_exchange(self) -> ccxt_async.Exchange:
+        """Initialize async CCXT exchange instance (WebSocket-capable where available)"""
         try:
-            exchange_class = getattr(ccxt, self.config.exchange)
+            # ccxt.pro classes extend the async REST classes with watch_* streams
+            exchange_class = _EXCHANGE_CLASSES.get(self.config.exchange)
+            if exchange_class is None:
+                exchange_class = _resolve_exchange_class(self.config.exchange)
             exchange_config = self.config.get_exchange_specific_config()
             
-            exchange = exchange_class(exchange_config)
-            
-            # Test connection
-            if not self.config.dry_run:
-                exchange.load_markets()
-                self.logger.info(f"Successfully connected to {self.config.exchange}")
-            
-            return exchange
+            return exchange_class(exchange_config)
         except Exception as e:
-            self.logger.error(f"Failed to initialize exchange: {str(e)}")
+            self.logger.error("Failed to initialize exchange: %s", e)
             raise
     
+    async def _exchange_call(self, method, *args):
+        """
+        Call an exchange REST method through the token bucket
+        
+        Rate-limit rejections shrink the bucket's burst size and are retried
+        with exponential backoff.
+        
+        Args:
+            method: Bound async exchange method
+            *args: Arguments for the method
+            
+        Returns:
+            The method's result
+        """
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            try:
+                async with self._bucket:
+                    return await method(*args)
+            except RATE_LIMIT_ERRORS as e:
+                if attempt == RATE_LIMIT_RETRIES:
+                    raise
+                
+                self._bucket.reduce_capacity()
+                delay = RATE_LIMIT_BACKOFF * 2 ** attempt
+                self.logger.warning("Rate limited on %s, retrying in %.1fs: %s",
+                                    method.__name__, delay, e)
+                await asyncio.sleep(delay)
+    
+    async def _connect_exchange(self):
+        """Load exchange markets, from the on-disk cache when fresh (live trading only)"""
+        if self.config.dry_run:
+            return
+        
+        if self._load_cached_markets():
+            self.logger.info("Loaded cached markets for %s", self.config.exchange)
+            return
+        
+        await self.exchange.load_markets()
+        self._save_cached_markets()
+        self.logger.info("Successfully connected to %s", self.config.exchange)
+    
+    def _markets_cache_path(self) -> str:
+        """Path of the markets cache file for this exchange and environment"""
+        suffix = '_testnet' if self.config.testnet else ''
+        return os.path.join(MARKETS_CACHE_DIR, f"{self.config.exchange}{suffix}_markets.json")
+    
+    def _load_cached_markets(self) -> bool:
+        """Populate exchange markets from the cache file if it is fresh"""
+        path = self._markets_cache_path()
+        try:
+            if time.time() - os.path.getmtime(path) >= MARKETS_CACHE_TTL:
+                return False
+            
+            with open(path) as f:
+                cached = json.load(f)
+            self.exchange.set_markets(cached['markets'], cached.get('currencies'))
+            return True
+        except (OSError, ValueError, KeyError) as e:
+            if not isinstance(e, FileNotFoundError):
+                self.logger.warning("Ignoring markets cache %s: %s", path, e)
+            return False
+    
+    def _save_cached_markets(self):
+        """Write the loaded exchange markets to the cache file"""
+        path = self._markets_cache_path()
+        try:
+            os.makedirs(MARKETS_CACHE_DIR, exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump({'markets': self.exchange.markets,
+                           'currencies': self.exchange.currencies}, f, default=str)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.warning("Failed to write markets cache %s: %s", path, e)
+    
     async def start(self):
         """Start the automated trading loop"""
         if self.is_running:
@@ -75,33 +233,138 @@ class AutomatedTrader:
             return
         
         self.is_running = True
+        self._wake = asyncio.Event()
         self.logger.info("Starting automated trading...")
         
         try:
+            self._open_http_session()
+            connected = False
+            backoff = 0.0
+            
             while self.is_running:
-                await self._trading_cycle()
-                await asyncio.sleep(60)  # Check every minute
+                try:
+                    if not connected:
+                        await self._connect_exchange()
+                        self._start_ticker_stream()
+                        connected = True
+                    
+                    await self._trading_cycle()
+                    backoff = 0.0
+                except TRANSIENT_EXCHANGE_ERRORS as e:
+                    # Back off exponentially with jitter, recovering once a cycle succeeds
+                    backoff = min(backoff * 2 or LOOP_BACKOFF_BASE, LOOP_BACKOFF_MAX)
+                    delay = backoff + random.uniform(0, backoff * 0.1)
+                    self.logger.warning("Transient exchange error, retrying in %.1fs: %s", delay, e)
+                    await self._wait_for_wakeup(delay)
+                    continue
+                
+                await self._wait_for_wakeup()
         except Exception as e:
-            self.logger.error(f"Trading loop error: {str(e)}")
+            self.logger.error("Trading loop error: %s", e)
             self.is_running = False
             raise
+        finally:
+            if self._ticker_task is not None:
+                self._ticker_task.cancel()
+                await asyncio.gather(self._ticker_task, return_exceptions=True)
+                self._ticker_task = None
+            
+            # Release the exchange's WebSocket clients, then the shared HTTP session
+            await self.exchange.close()
+            if self._http_session is not None:
+                await self._http_session.close()
+                self._http_session = None
+    
+    def _open_http_session(self):
+        """Create one keep-alive aiohttp session for all exchange and price requests"""
+        # ccxt applies its own per-request timeouts, and WebSocket streams must not
+        # be cut off by a session-wide total timeout
+        self._http_session = create_async_session(limit=20, timeout=None)
+        
+        # ccxt leaves sessions it didn't create open on close()
+        self.exchange.session = self._http_session
+        self.exchange.own_session = False
+        
+        crypto_provider = getattr(self.model, 'crypto_provider', None)
+        if hasattr(crypto_provider, 'use_async_session'):
+            crypto_provider.use_async_session(self._http_session)
+    
+    async def _wait_for_wakeup(self, timeout: float = CYCLE_INTERVAL):
+        """Wait until woken by a price move, model update or stop, or the timeout"""
+        try:
+            await asyncio.wait_for(self._wake.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        self._wake.clear()
+    
+    def notify_model_update(self):
+        """Signal that model inputs changed so the next cycle re-checks signals immediately"""
+        self._model_updated = True
+        if self._wake is not None:
+            self._wake.set()
+    
+    def _start_ticker_stream(self):
+        """Subscribe to the BTC ticker over WebSocket when the exchange supports it"""
+        if self.config.dry_run or not self.exchange.has.get('watchTicker'):
+            return
+        
+        self._ticker_task = asyncio.create_task(self._ticker_stream())
+        self.logger.info("Streaming %s ticker over WebSocket", self.primary_symbol)
+    
+    async def _ticker_stream(self):
+        """Keep the cached BTC price current from pushed ticker updates"""
+        while self.is_running:
+            try:
+                ticker = await self.exchange.watch_ticker(self.primary_symbol)
+                price = float(ticker['last'])
+                self._price_cache = (price, time.monotonic())
+                
+                # React to large moves now rather than at the next scheduled cycle
+                if (self._cycle_price and
+                        abs(price - self._cycle_price) / self._cycle_price >= PRICE_WAKE_THRESHOLD):
+                    self._wake.set()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Prices fall back to REST polling while the stream reconnects
+                self.logger.warning("Ticker stream error: %s", e)
+                await asyncio.sleep(5)
     
     def stop(self):
         """Stop the automated trading loop"""
         self.logger.info("Stopping automated trading...")
         self.is_running = False
+        if self._wake is not None:
+            self._wake.set()
     
     async def _trading_cycle(self):
         """Execute one cycle of the trading loop"""
+        await self._reap_pending_orders()
+        
         try:
-            # Health check
-            if not await self._health_check():
+            # Health check and market data are independent, so fetch them concurrently
+            healthy, btc_price, portfolio_value = await asyncio.gather(
+                self._health_check(),
+                self._get_btc_price(),
+                self._get_portfolio_value(),
+                return_exceptions=True
+            )
+            
+            outcomes = (healthy, btc_price, portfolio_value)
+            for outcome in outcomes:
+                if isinstance(outcome, LOOP_CONTROL_ERRORS):
+                    raise outcome
+            
+            for outcome in outcomes:
+                if isinstance(outcome, Exception):
+                    self.logger.error("Error fetching cycle data: %s", outcome)
+                    return
+            
+            if not healthy:
                 self.logger.warning("Health check failed, skipping cycle")
                 return
             
-            # Get current market data
-            btc_price = await self._get_btc_price()
-            portfolio_value = await self._get_portfolio_value()
+            self._cycle_price = btc_price
             
             # Safety check
             safety_check = self.safety_manager.check_safety_conditions(
@@ -109,71 +372,85 @@ class AutomatedTrader:
             )
             
             if not safety_check['safe_to_trade']:
-                self.logger.warning(f"Safety check failed: {safety_check['reasons']}")
+                self.logger.warning("Safety check failed: %s", safety_check['reasons'])
                 return
             
-            # Check for signals (only check every 15 minutes to avoid overload)
-            now = datetime.now()
-            if (self.last_signal_check is None or 
-                now - self.last_signal_check >= timedelta(minutes=15)):
+            # Check for signals on model updates, otherwise only every 15 minutes to avoid overload
+            now = time.monotonic()
+            if (self._model_updated or self._last_signal_check_mono is None or 
+                now - self._last_signal_check_mono >= SIGNAL_CHECK_INTERVAL):
                 
-                await self._check_and_execute_signals(portfolio_value)
-                self.last_signal_check = now
+                self._model_updated = False
+                await self._check_and_execute_signals(portfolio_value, btc_price)
+                self._last_signal_check_mono = now
+                self.last_signal_check = datetime.now()
             
             # Monitor existing positions
             await self._monitor_positions()
             
+        except LOOP_CONTROL_ERRORS:
+            # Left to the trading loop to back off from or stop on
+            raise
         except Exception as e:
-            self.logger.error(f"Error in trading cycle: {str(e)}")
+            self.logger.error("Error in trading cycle: %s", e)
     
-    async def _check_and_execute_signals(self, portfolio_value: float):
+    async def _check_and_execute_signals(self, portfolio_value: float, btc_price: float):
         """Check for new signals and execute trades"""
         try:
-            # Get strongest signal across all scenarios
-            result = self.model.get_strongest_signal(portfolio_value)
+            # Get strongest signal across all scenarios; the model fetches data
+            # synchronously, so run it off the event loop
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(
+                None, self.model.get_strongest_signal_result, portfolio_value
+            )
             
-            if result.get('signals', {}).get('buy_signal', False):
-                trade_plan = result.get('trade_plan', {})
-                
-                self.logger.info(f"Buy signal detected: {result['scenario_name']}")
-                self.logger.info(f"Signal strength: {result['signals']['combined_score']:.3f}")
-                
-                await self._execute_trade_plan(trade_plan, portfolio_value)
-            else:
+            if not result.buy_signal:
                 self.logger.debug("No buy signals detected")
-                
+                return
+            
+            self.logger.info("Buy signal detected: %s", result.scenario_name)
+            self.logger.info("Signal strength: %.3f", result.combined_score)
+            
+            await self._execute_trade_plan(result.trade_plan, portfolio_value, btc_price)
+            
         except Exception as e:
-            self.logger.error(f"Error checking signals: {str(e)}")
+            self.logger.error("Error checking signals: %s", e)
     
     async def _execute_trade_plan(self, trade_plan: Dict[str, Any], 
-                                  portfolio_value: float):
+                                  portfolio_value: float, btc_price: float):
         """Execute a trade plan"""
         if trade_plan.get('action') != 'buy' and trade_plan.get('action') != 'accumulate':
-            self.logger.info(f"No action required: {trade_plan.get('action', 'none')}")
+            self.logger.info("No action required: %s", trade_plan.get('action', 'none'))
             return
         
         position_size = trade_plan.get('position_size', 0)
-        target_btc_amount = portfolio_value * position_size / await self._get_btc_price()
+        target_btc_amount = portfolio_value * position_size / btc_price
+        
+        # Count orders still awaiting acknowledgement so they aren't bought twice
+        self.target_positions[0] = target_btc_amount
+        committed_position = self.current_position + self._pending_amounts()[0]
         
         # Check if we already have sufficient position
-        if self.current_position >= target_btc_amount * 0.9:  # 90% tolerance
-            self.logger.info(f"Already have sufficient position: {self.current_position:.4f} BTC")
+        if committed_position >= target_btc_amount * 0.9:  # 90% tolerance
+            self.logger.info("Already have sufficient position: %.4f BTC", committed_position)
             return
         
         # Calculate how much more BTC to buy
-        btc_to_buy = target_btc_amount - self.current_position
+        btc_to_buy = target_btc_amount - committed_position
         
         if btc_to_buy < self.config.min_order_size_btc:
-            self.logger.info(f"Order size too small: {btc_to_buy:.4f} BTC")
+            self.logger.info("Order size too small: %.4f BTC", btc_to_buy)
             return
         
         # Execute based on entry strategy
         entry_strategy = trade_plan.get('entry_strategy', 'immediate')
         
+        entry_plan = trade_plan.get('entry_plan', [])
+        
         if entry_strategy == 'scaled_72h':
-            await self._execute_scaled_entry(btc_to_buy, '72h')
+            await self._execute_scaled_entry(btc_to_buy, '72h', entry_plan)
         elif entry_strategy == 'accumulate_30_days':
-            await self._execute_scaled_entry(btc_to_buy, '30d')
+            await self._execute_scaled_entry(btc_to_buy, '30d', entry_plan)
         else:
             await self._execute_immediate_buy(btc_to_buy)
     
@@ -181,7 +458,7 @@ class AutomatedTrader:
         """Execute immediate market buy"""
         try:
             if self.config.dry_run:
-                self.logger.info(f"DRY RUN: Would buy {btc_amount:.4f} BTC immediately")
+                self.logger.info("DRY RUN: Would buy %.4f BTC immediately", btc_amount)
                 self.current_position += btc_amount
                 return
             
@@ -189,67 +466,297 @@ class AutomatedTrader:
             order = await self._place_order('buy', btc_amount, order_type='market')
             
             if order:
-                self.logger.info(f"Executed immediate buy: {btc_amount:.4f} BTC")
+                self.logger.info("Executed immediate buy: %.4f BTC", btc_amount)
                 self.current_position += btc_amount
             
         except Exception as e:
-            self.logger.error(f"Failed to execute immediate buy: {str(e)}")
+            self.logger.error("Failed to execute immediate buy: %s", e)
+    
+    async def _execute_scaled_entry(self, total_btc_amount: float, timeframe: str,
+                                    entry_plan: List[Dict[str, Any]] = None):
+        """
+        Execute scaled entry as a batch of child orders
+        
+        Args:
+            total_btc_amount: Total BTC to buy across all slices
+            timeframe: Scaling timeframe ('72h' or '30d')
+            entry_plan: Trade plan slices; each 'percentage' sets a child order's share
+        """
+        weights = [step['percentage'] for step in entry_plan or []] or [1.0]
+        slices = [total_btc_amount * weight for weight in weights]
+        
+        if min(slices) < self.config.min_order_size_btc:
+            self.logger.info("Slices below minimum order size, "
+                             "executing immediate buy of %.4f BTC", total_btc_amount)
+            await self._execute_immediate_buy(total_btc_amount)
+            return
+        
+        # TODO: Implement actual time-based scaling; slices are currently submitted together
+        self.logger.info("Scaled entry (%s): submitting %d child orders for %.4f BTC",
+                         timeframe, len(slices), total_btc_amount)
+        
+        # Child orders are queued without waiting on each exchange acknowledgement;
+        # fills are applied to the position as acknowledgements arrive
+        tickets = await asyncio.gather(
+            *[self._place_order('buy', slice_amount, order_type='market', asynchronous=True)
+              for slice_amount in slices]
+        )
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Queued child orders: %s", [ticket['id'] for ticket in tickets if ticket])
+    
+    def _pending_amounts(self) -> np.ndarray:
+        """Per-symbol amounts in orders submitted but not yet acknowledged"""
+        pending = np.zeros(len(self.symbols))
+        for order in self.pending_orders.values():
+            pending[self._symbol_index[order['symbol']]] += order['amount']
+        return pending
     
-    async def _execute_scaled_entry(self, total_btc_amount: float, timeframe: str):
-        """Execute scaled entry over time"""
-        # For now, implement as immediate buy
-        # TODO: Implement actual time-based scaling
-        self.logger.info(f"Scaled entry ({timeframe}) not yet implemented, "
-                        f"executing immediate buy of {total_btc_amount:.4f} BTC")
-        await self._execute_immediate_buy(total_btc_amount)
+    def set_target_positions(self, targets: Dict[str, float]):
+        """
+        Set target position sizes for traded symbols
+        
+        Args:
+            targets: Target size in base currency units by symbol; unlisted symbols keep their target
+        """
+        for symbol, target in targets.items():
+            self.target_positions[self._symbol_index[symbol]] = target
+    
+    async def rebalance_to_targets(self) -> List[Dict[str, Any]]:
+        """
+        Buy every symbol whose target exceeds its committed position
+        
+        Position gaps are computed across all symbols at once and the resulting
+        orders are submitted together.
+        
+        Returns:
+            Pending order tickets that were submitted
+        """
+        delta = self.target_positions - (self.positions + self._pending_amounts())
+        to_buy = np.where(delta >= self.config.min_order_size_btc, delta, 0.0)
+        
+        tickets = await asyncio.gather(
+            *[self._place_order('buy', float(to_buy[i]), order_type='market',
+                                asynchronous=True, symbol=self.symbols[i])
+              for i in np.flatnonzero(to_buy)]
+        )
+        return [ticket for ticket in tickets if ticket]
     
     async def _place_order(self, side: str, amount: float, 
                           order_type: str = 'market', 
-                          price: Optional[float] = None) -> Optional[Dict[str, Any]]:
-        """Place an order on the exchange"""
+                          price: Optional[float] = None,
+                          asynchronous: bool = False,
+                          symbol: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Place an order on the exchange
+        
+        Args:
+            side: Order side
+            amount: Order amount in base currency (BTC for the primary symbol)
+            order_type: 'market' or 'limit'
+            price: Limit price
+            asynchronous: If True, return a client ticket immediately and apply the
+                          exchange acknowledgement to the position when it arrives
+            symbol: Symbol to trade, defaulting to the primary symbol
+            
+        Returns:
+            Exchange order, pending ticket when asynchronous, or None on failure
+        """
+        symbol = symbol or self.primary_symbol
+        
+        if not asynchronous:
+            return await self._submit_order(side, amount, order_type, price, symbol)
+        
+        if len(self.pending_orders) >= self.config.max_pending_orders:
+            self.logger.error("Too many pending orders (%d), rejecting %s of %.4f BTC",
+                              len(self.pending_orders), side, amount)
+            return None
+        
+        client_id = f'bsi_{uuid.uuid4().hex}'
+        ticket = {
+            'id': client_id,
+            'symbol': symbol,
+            'side': side,
+            'amount': amount,
+            'price': price,
+            'type': order_type,
+            'status': 'pending',
+            'submitted_at': time.monotonic()
+        }
+        self.pending_orders[client_id] = ticket
+        
+        task = asyncio.create_task(
+            self._submit_order(side, amount, order_type, price, symbol, client_id=client_id))
+        self._order_tasks[client_id] = task
+        task.add_done_callback(lambda done: self._on_order_ack(client_id, done))
+        
+        return ticket
+    
+    def _on_order_ack(self, client_id: str, task: asyncio.Task):
+        """Resolve a pending order once its submission task completes"""
+        self._order_tasks.pop(client_id, None)
+        ticket = self.pending_orders.get(client_id)
+        if ticket is None:
+            return
+        
+        order = None if task.cancelled() else task.result()
+        if not order:
+            if self.config.dry_run:
+                self.pending_orders.pop(client_id, None)
+                self.logger.error("Order %s was not acknowledged", client_id)
+            else:
+                # The request may still have reached the exchange, so the order stays
+                # counted as pending until the housekeeper finds it there
+                ticket['status'] = 'unknown'
+                self.logger.error("Order %s was not acknowledged; status unknown", client_id)
+            return
+        
+        self.pending_orders.pop(client_id, None)
+        filled = order.get('filled') or ticket['amount']
+        self._apply_fill(ticket, filled)
+        self.logger.info("Order %s acknowledged: %.4f %s (%s)",
+                         client_id, filled, ticket['symbol'], order.get('id'))
+    
+    def _apply_fill(self, ticket: Dict[str, Any], filled: float):
+        """Add an order's filled amount to the position of its symbol"""
+        if ticket['side'] == 'buy':
+            self.positions[self._symbol_index[ticket['symbol']]] += filled
+    
+    async def _reap_pending_orders(self):
+        """
+        Settle pending orders whose submission outcome is unknown
+        
+        Submissions still unacknowledged past the order timeout are cancelled
+        locally. Tickets without an acknowledgement are then looked up on the
+        exchange by client order id: fills are applied to the position and
+        terminal orders dropped, while orders the exchange cannot report on
+        stay counted as pending.
+        """
+        now = time.monotonic()
+        for client_id, ticket in list(self.pending_orders.items()):
+            stale = now - ticket['submitted_at'] > self.config.order_timeout
+            task = self._order_tasks.get(client_id)
+            if task is not None:
+                if stale:
+                    self.logger.warning("Order %s unacknowledged after %ss; checking the exchange",
+                                        client_id, self.config.order_timeout)
+                    task.cancel()  # the done-callback marks the ticket unknown
+                continue
+            
+            if ticket['status'] == 'unknown':
+                await self._resolve_order(client_id, ticket, stale)
+    
+    async def _resolve_order(self, client_id: str, ticket: Dict[str, Any], stale: bool):
+        """Look up an unacknowledged order on the exchange and settle its ticket"""
+        try:
+            order = await self._exchange_call(self.exchange.fetch_order, client_id,
+                                              ticket['symbol'], {'clientOrderId': client_id})
+        except ccxt_async.OrderNotFound:
+            # Nothing reached the exchange, so nothing can fill
+            self.pending_orders.pop(client_id, None)
+            self.logger.warning("Order %s not found on the exchange; dropping", client_id)
+            return
+        except LOOP_CONTROL_ERRORS:
+            raise
+        except Exception as e:
+            self.logger.warning("Could not query order %s, keeping it pending: %s", client_id, e)
+            return
+        
+        status = order.get('status')
+        if status in TERMINAL_ORDER_STATUSES:
+            self.pending_orders.pop(client_id, None)
+            filled = order.get('filled')
+            if filled is None:
+                filled = ticket['amount'] if status == 'closed' else 0.0
+            self._apply_fill(ticket, filled)
+            self.logger.info("Order %s %s on the exchange: %.4f %s filled (%s)",
+                             client_id, status, filled, ticket['symbol'], order.get('id'))
+        elif status == 'open' and stale:
+            # Cancel on the exchange; the next lookup applies any partial fill
+            self.logger.warning("Order %s still open after %ss; cancelling",
+                                client_id, self.config.order_timeout)
+            try:
+                await self._exchange_call(self.exchange.cancel_order, order['id'], ticket['symbol'])
+            except LOOP_CONTROL_ERRORS:
+                raise
+            except Exception as e:
+                self.logger.warning("Failed to cancel order %s: %s", client_id, e)
+    
+    async def _submit_order(self, side: str, amount: float, order_type: str,
+                            price: Optional[float], symbol: str,
+                            client_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Submit an order and wait for the exchange acknowledgement"""
         try:
             if self.config.dry_run:
-                current_price = await self._get_btc_price()
+                # Only the primary symbol has a reference price in dry run
+                if price is None and symbol == self.primary_symbol:
+                    price = await self._get_btc_price()
                 order = {
                     'id': f'dry_run_{datetime.now().timestamp()}',
+                    'symbol': symbol,
                     'side': side,
                     'amount': amount,
-                    'price': price or current_price,
+                    'price': price,
                     'type': order_type,
                     'status': 'filled',
                     'filled': amount,
-                    'cost': amount * (price or current_price)
+                    'cost': amount * price if price is not None else None
                 }
-                self.logger.info(f"DRY RUN ORDER: {order}")
+                self._log_order("DRY RUN order", order)
                 return order
             
-            # Real order execution
-            symbol = 'BTC/USDT'  # or 'BTC/USD' depending on exchange
-            
+            # Real order execution, tagged with the client id so the order can be
+            # looked up if the acknowledgement is lost
+            params = {'clientOrderId': client_id} if client_id else {}
             if order_type == 'market':
-                order = self.exchange.create_market_buy_order(symbol, amount)
+                order = await self._exchange_call(self.exchange.create_market_buy_order,
+                                                 symbol, amount, params)
             else:
-                order = self.exchange.create_limit_buy_order(symbol, amount, price)
+                order = await self._exchange_call(self.exchange.create_limit_buy_order,
+                                                 symbol, amount, price, params)
             
-            self.logger.info(f"Order placed: {order}")
+            self._log_order("Order placed", order)
             return order
             
         except Exception as e:
-            self.logger.error(f"Failed to place order: {str(e)}")
+            self.logger.error("Failed to place order: %s", e)
             return None
     
+    def _fresh_price(self) -> Optional[float]:
+        """Cached BTC price if it was streamed or fetched within the TTL"""
+        if self._price_cache is not None:
+            price, fetched_at = self._price_cache
+            if time.monotonic() - fetched_at < self._price_ttl:
+                return price
+        return None
+    
+    def _log_order(self, event: str, order: Dict[str, Any]):
+        """Log the key fields of an order rather than the full exchange payload"""
+        self.logger.info("%s id=%s symbol=%s side=%s type=%s amount=%s price=%s status=%s",
+                         event, order.get('id'), order.get('symbol'), order.get('side'),
+                         order.get('type'), order.get('amount'), order.get('price'),
+                         order.get('status'))
+    
     async def _get_btc_price(self) -> float:
-        """Get current BTC price"""
+        """Get current BTC price from the ticker stream, or REST when it is stale"""
+        price = self._fresh_price()
+        if price is not None:
+            return price
+        
         try:
             if self.config.dry_run:
-                # Use CoinGecko for dry run
-                return self.model.crypto_provider.get_bitcoin_price() or 50000.0
+                # Use CoinGecko for dry run, over the shared async session
+                price = await self.model.crypto_provider.aget_bitcoin_price() or 50000.0
+            else:
+                ticker = await self._exchange_call(self.exchange.fetch_ticker, self.primary_symbol)
+                price = float(ticker['last'])
             
-            ticker = self.exchange.fetch_ticker('BTC/USDT')
-            return float(ticker['last'])
+            self._price_cache = (price, time.monotonic())
+            return price
             
+        except LOOP_CONTROL_ERRORS:
+            raise
         except Exception as e:
-            self.logger.error(f"Failed to get BTC price: {str(e)}")
+            self.logger.error("Failed to get BTC price: %s", e)
             return 50000.0  # Fallback price
     
     async def _get_portfolio_value(self) -> float:
@@ -258,13 +765,15 @@ class AutomatedTrader:
             if self.config.dry_run:
                 return 100000.0  # Default dry run portfolio value
             
-            balance = self.exchange.fetch_balance()
+            balance = await self._exchange_call(self.exchange.fetch_balance)
             # Calculate portfolio value from balance
             # This is simplified - real implementation would be more complex
             return float(balance.get('total', {}).get('USDT', 100000.0))
             
+        except LOOP_CONTROL_ERRORS:
+            raise
         except Exception as e:
-            self.logger.error(f"Failed to get portfolio value: {str(e)}")
+            self.logger.error("Failed to get portfolio value: %s", e)
             return 100000.0  # Fallback value
     
     async def _monitor_positions(self):
@@ -280,23 +789,28 @@ class AutomatedTrader:
         """Perform health check on exchange and model"""
         try:
             # Check model health
-            model_health = self.model.health_check()
+            model_health = await self.model.health_check_async()
             if model_health.get('overall_status') == 'error':
                 self.logger.error("Model health check failed")
                 return False
             
-            # Check exchange connection (only for live trading)
-            if not self.config.dry_run:
+            # Check exchange connection (only for live trading); a fresh streamed
+            # price already shows the connection is up
+            if not self.config.dry_run and self._fresh_price() is None:
                 try:
-                    self.exchange.fetch_ticker('BTC/USDT')
+                    await self._exchange_call(self.exchange.fetch_ticker, self.primary_symbol)
+                except LOOP_CONTROL_ERRORS:
+                    raise
                 except Exception as e:
-                    self.logger.error(f"Exchange connection failed: {str(e)}")
+                    self.logger.error("Exchange connection failed: %s", e)
                     return False
             
             return True
             
+        except LOOP_CONTROL_ERRORS:
+            raise
         except Exception as e:
-            self.logger.error(f"Health check failed: {str(e)}")
+            self.logger.error("Health check failed: %s", e)
             return False
     
     def get_status(self) -> Dict[str, Any]:
@@ -306,6 +820,7 @@ class AutomatedTrader:
             'exchange': self.config.exchange,
             'dry_run': self.config.dry_run,
             'current_position': self.current_position,
+            'positions': dict(zip(self.symbols, self.positions.tolist())),
             'last_signal_check': self.last_signal_check.isoformat() if self.last_signal_check else None,
             'pending_orders': len(self.pending_orders),
             'safety_status': {
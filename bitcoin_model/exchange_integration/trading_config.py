@@ -2,10 +2,15 @@
 Trading configuration and safety settings for automated trading
 """
 
-from dataclasses import dataclass, field
-from typing import Dict, Any, Optional, List
+from dataclasses import dataclass
+from functools import cached_property
+from datetime import datetime, date, timezone
+from typing import Dict, Any, Optional, List, Tuple
 from enum import Enum
+import asyncio
 import logging
+import time
+import numpy as np
 
 class ExchangeType(Enum):
     """Supported exchange types"""
@@ -23,9 +28,22 @@ class OrderType(Enum):
     LIMIT = "limit"
     LIMIT_MAKER = "limit_maker"
 
-@dataclass
+_SUPPORTED_EXCHANGES = frozenset(exchange.value for exchange in ExchangeType)
+
+# Exchange-specific additions to the CCXT config, keyed by exchange id
+_EXCHANGE_EXTRA = {
+    'coinbase': lambda cfg: {'passphrase': cfg.api_passphrase, 'pro': True},
+    'binance': lambda cfg: {'options': {'defaultType': 'spot'}},
+}
+
+@dataclass(frozen=True)
 class TradingConfig:
-    """Configuration for automated trading"""
+    """
+    Configuration for automated trading
+    
+    Immutable and hashable once created, so derived values are computed once
+    and one instance can be shared freely.
+    """
     
     # Exchange settings
     exchange: str
@@ -45,6 +63,10 @@ class TradingConfig:
     default_order_type: OrderType = OrderType.LIMIT
     slippage_tolerance: float = 0.02  # 2% slippage tolerance
     order_timeout: int = 300  # Order timeout in seconds
+    max_pending_orders: int = 20  # Maximum unacknowledged orders in flight
+    
+    # Traded symbols; the first is the one the model's BTC signals trade
+    symbols: Tuple[str, ...] = ('BTC/USDT',)
     
     # Rate limiting
     requests_per_minute: int = 20
@@ -73,9 +95,7 @@ class TradingConfig:
             errors.append("API secret is required")
         
         # Check exchange support
-        try:
-            ExchangeType(self.exchange)
-        except ValueError:
+        if self.exchange not in _SUPPORTED_EXCHANGES:
             errors.append(f"Unsupported exchange: {self.exchange}")
         
         # Check safety limits
@@ -91,6 +111,12 @@ class TradingConfig:
         if self.slippage_tolerance < 0 or self.slippage_tolerance > 0.5:
             errors.append("slippage_tolerance must be between 0 and 0.5")
         
+        if not self.symbols:
+            errors.append("At least one symbol is required")
+        
+        if self.max_pending_orders <= 0:
+            errors.append("max_pending_orders must be positive")
+        
         # Warn about safety settings
         if not self.testnet:
             errors.append("WARNING: testnet=False means real money trading!")
@@ -100,47 +126,84 @@ class TradingConfig:
         
         return errors
     
-    def get_exchange_specific_config(self) -> Dict[str, Any]:
-        """
-        Get exchange-specific configuration
-        
-        Returns:
-            Dictionary with exchange-specific settings
-        """
+    @cached_property
+    def validation_errors(self) -> Tuple[str, ...]:
+        """Validation errors, computed once since the config is immutable"""
+        return tuple(self.validate())
+    
+    @cached_property
+    def exchange_config(self) -> Dict[str, Any]:
+        """Exchange-specific CCXT configuration, built once"""
         base_config = {
             'apiKey': self.api_key,
             'secret': self.api_secret,
             'sandbox': self.testnet,
             'enableRateLimit': True,
-            'rateLimit': 60000 / self.requests_per_minute  # ms between requests
+            'rateLimit': self.rate_limit_ms
         }
         
         # Exchange-specific settings
-        if self.exchange == 'coinbase':
-            base_config['passphrase'] = self.api_passphrase
-            base_config['pro'] = True
-        elif self.exchange == 'binance':
-            base_config['options'] = {'defaultType': 'spot'}
-        elif self.exchange == 'kraken':
-            base_config['apiKey'] = self.api_key
+        extra = _EXCHANGE_EXTRA.get(self.exchange)
+        if extra is not None:
+            base_config.update(extra(self))
         
         return base_config
+    
+    def get_exchange_specific_config(self) -> Dict[str, Any]:
+        """
+        Get exchange-specific configuration
+        
+        Returns:
+            Dictionary with exchange-specific settings (a copy callers may modify)
+        """
+        return dict(self.exchange_config)
+    
+    @cached_property
+    def rate_limit_ms(self) -> float:
+        """Milliseconds between requests for CCXT's built-in throttle"""
+        return 60000 / self.requests_per_minute
+
+# Number of recent price checks kept for the rolling price window statistics
+# (one per trading cycle, so about a day at the default one-minute cadence)
+PRICE_WINDOW_SIZE = 1440
 
-@dataclass
 class SafetyManager:
     """Safety checks and circuit breakers for automated trading"""
     
-    daily_loss_limit: float = 0.02  # 2% daily loss limit
-    consecutive_loss_limit: int = 3  # Stop after 3 consecutive losses
-    unusual_price_movement_threshold: float = 0.10  # 10% price movement
-    
-    # State tracking
-    daily_pnl: float = field(default=0.0, init=False)
-    consecutive_losses: int = field(default=0, init=False)
-    last_price_check: float = field(default=0.0, init=False)
-    trades_today: int = field(default=0, init=False)
+    # Plain slotted class (not a dataclass) so per-instance state stays compact;
+    # dataclass(slots=True) would need Python 3.10+
+    __slots__ = (
+        'daily_loss_limit', 'consecutive_loss_limit', 'unusual_price_movement_threshold',
+        'daily_pnl', 'consecutive_losses', 'last_price_check', 'trades_today',
+        'last_reset_date', 'logger', '_price_window', '_price_count'
+    )
     
-    def __post_init__(self):
+    def __init__(self, daily_loss_limit: float = 0.02,
+                 consecutive_loss_limit: int = 3,
+                 unusual_price_movement_threshold: float = 0.10):
+        """
+        Initialize safety manager
+        
+        Args:
+            daily_loss_limit: Maximum daily loss as a fraction of portfolio (2%)
+            consecutive_loss_limit: Stop after this many consecutive losses
+            unusual_price_movement_threshold: Price move that triggers a warning (10%)
+        """
+        self.daily_loss_limit = daily_loss_limit
+        self.consecutive_loss_limit = consecutive_loss_limit
+        self.unusual_price_movement_threshold = unusual_price_movement_threshold
+        
+        # State tracking
+        self.daily_pnl = 0.0
+        self.consecutive_losses = 0
+        self.last_price_check = 0.0
+        self.trades_today = 0
+        self.last_reset_date: date = datetime.now(timezone.utc).date()
+        
+        # Ring buffer of recent checked prices; _price_count is the total recorded
+        self._price_window = np.zeros(PRICE_WINDOW_SIZE)
+        self._price_count = 0
+        
         self.logger = logging.getLogger(__name__)
     
     def check_safety_conditions(self, current_portfolio_value: float,
@@ -161,6 +224,10 @@ class SafetyManager:
             'warnings': []
         }
         
+        # Daily counters roll over at UTC midnight
+        if datetime.now(timezone.utc).date() != self.last_reset_date:
+            self.reset_daily_counters()
+        
         # Check daily loss limit
         daily_loss_pct = abs(self.daily_pnl) / current_portfolio_value
         if daily_loss_pct >= self.daily_loss_limit:
@@ -172,16 +239,49 @@ class SafetyManager:
             checks['safe_to_trade'] = False
             checks['reasons'].append(f"Consecutive loss limit exceeded: {self.consecutive_losses}")
         
-        # Check for unusual price movements
+        # Check for unusual price movements since the previous check
         if self.last_price_check > 0:
             price_change = abs(btc_price - self.last_price_check) / self.last_price_check
             if price_change >= self.unusual_price_movement_threshold:
                 checks['warnings'].append(f"Unusual price movement detected: {price_change:.2%}")
         
-        self.last_price_check = btc_price
+        self._record_price(btc_price)
         
         return checks
     
+    def _record_price(self, btc_price: float):
+        """Add a checked price to the ring buffer"""
+        if btc_price > 0:
+            self._price_window[self._price_count % PRICE_WINDOW_SIZE] = btc_price
+            self._price_count += 1
+        self.last_price_check = btc_price
+    
+    def price_window_stats(self) -> Dict[str, float]:
+        """
+        Realized volatility and maximum drawdown over the recent price window
+        
+        A rolling measure over the last PRICE_WINDOW_SIZE checked prices (not
+        reset with the daily counters); it is informational and does not
+        affect check_safety_conditions.
+        
+        Returns:
+            Dictionary with realized_volatility (standard deviation of per-check
+            log returns) and max_drawdown (largest fall from a running peak)
+        """
+        prices = self._price_window[:min(self._price_count, PRICE_WINDOW_SIZE)]
+        if self._price_count > PRICE_WINDOW_SIZE:
+            # Oldest first once the ring buffer has wrapped
+            prices = np.roll(prices, -(self._price_count % PRICE_WINDOW_SIZE))
+        if prices.size < 2:
+            return {'realized_volatility': 0.0, 'max_drawdown': 0.0}
+        
+        returns = np.diff(np.log(prices))
+        drawdowns = 1.0 - prices / np.maximum.accumulate(prices)
+        return {
+            'realized_volatility': float(np.std(returns)),
+            'max_drawdown': float(np.max(drawdowns))
+        }
+    
     def record_trade_result(self, pnl: float, is_profitable: bool):
         """
         Record trade result for safety tracking
@@ -198,12 +298,61 @@ class SafetyManager:
         else:
             self.consecutive_losses += 1
         
-        self.logger.info(f"Trade recorded: PnL={pnl:.2f}, "
-                        f"Daily PnL={self.daily_pnl:.2f}, "
-                        f"Consecutive losses={self.consecutive_losses}")
+        self.logger.info("Trade recorded: PnL=%.2f, Daily PnL=%.2f, Consecutive losses=%d",
+                         pnl, self.daily_pnl, self.consecutive_losses)
     
     def reset_daily_counters(self):
-        """Reset daily tracking counters (call at start of each day)"""
+        """Reset daily tracking counters (runs automatically at the start of each UTC day)"""
         self.daily_pnl = 0.0
         self.trades_today = 0
-        self.logger.info("Daily safety counters reset")
\ No newline at end of file
+        self.last_reset_date = datetime.now(timezone.utc).date()
+        self.logger.info("Daily safety counters reset")
+
+class AsyncTokenBucket:
+    """Token-bucket limiter for exchange requests, allowing short bursts up to capacity"""
+    
+    def __init__(self, capacity: int, refill_rate: float):
+        """
+        Initialize the token bucket
+        
+        Args:
+            capacity: Maximum burst size in requests
+            refill_rate: Tokens added per second
+        """
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock: Optional[asyncio.Lock] = None  # Created on first acquire, in the running loop
+        self.logger = logging.getLogger(__name__)
+    
+    def _refill(self):
+        """Add tokens accrued since the last update"""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.refill_rate)
+        self._updated = now
+    
+    async def acquire(self, n: int = 1):
+        """Wait without blocking the event loop until n tokens are available, then take them"""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            self._refill()
+            while self._tokens < n:
+                await asyncio.sleep((n - self._tokens) / self.refill_rate)
+                self._refill()
+            self._tokens -= n
+    
+    def reduce_capacity(self):
+        """Shrink the burst size after the exchange rejects requests for rate limiting"""
+        if self.capacity > 1:
+            self.capacity -= 1
+            self._tokens = min(self._tokens, self.capacity)
+            self.logger.warning("Exchange rate limited, burst capacity reduced to %d", self.capacity)
+    
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
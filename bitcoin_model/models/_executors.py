@@ -0,0 +1,11 @@
+"""
+Thread pool shared by the scenario models for concurrent I/O
+"""
+
+import atexit
+from concurrent.futures import ThreadPoolExecutor
+
+# Only leaf I/O calls are submitted (never work that itself waits on the pool),
+# so the bounded pool cannot deadlock on nested tasks
+IO_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix='model-io')
+atexit.register(IO_POOL.shutdown, wait=False)
@@ -0,0 +1,165 @@
+"""
+Shared behaviour for scenario models
+"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Dict, Any, Optional, Tuple
+from datetime import datetime
+import numpy as np
+
+from ..utils.time_utils import now_iso
+from ._executors import IO_POOL
+
+def frozen_split(template: Tuple[Tuple[str, float], ...]) -> np.ndarray:
+    """
+    Build the read-only array of position shares from an entry plan template
+    
+    Args:
+        template: (timing, share of the position) pairs
+        
+    Returns:
+        Read-only float array of the shares, in template order
+    """
+    split = np.array([percentage for _, percentage in template])
+    split.flags.writeable = False
+    return split
+
+@dataclass(frozen=True)
+class ScenarioResult:
+    """
+    Flat view of one scenario analysis
+    
+    Holds the scalar fields consumers aggregate across runs (for example one
+    DataFrame row per backtest step) without walking the nested result dict.
+    """
+    
+    __slots__ = ('scenario', 'scenario_name', 'combined_score', 'buy_signal',
+                 'signal_strength', 'threshold', 'action', 'position_size',
+                 'position_value', 'entry_plan', 'timestamp')
+    
+    scenario: int
+    scenario_name: str
+    combined_score: float
+    buy_signal: bool
+    signal_strength: str
+    threshold: float
+    action: str
+    position_size: float
+    position_value: float
+    entry_plan: Tuple[Tuple[str, float], ...]  # (timing, value) pairs
+    timestamp: str
+    
+    @classmethod
+    def from_result(cls, result: Dict[str, Any]) -> 'ScenarioResult':
+        """Flatten an analysis result dictionary"""
+        signals = result['signals']
+        trade_plan = result['trade_plan']
+        return cls(
+            scenario=result['scenario'],
+            scenario_name=result['scenario_name'],
+            combined_score=signals['combined_score'],
+            buy_signal=signals['buy_signal'],
+            signal_strength=signals['signal_strength'],
+            threshold=signals['threshold'],
+            action=trade_plan['action'],
+            position_size=trade_plan['position_size'],
+            position_value=trade_plan.get('position_value', 0.0),
+            entry_plan=tuple((step['timing'], step['value'])
+                             for step in trade_plan.get('entry_plan', ())),
+            timestamp=result['timestamp']
+        )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Flat dictionary of the fields, e.g. a DataFrame row"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+class ScenarioModel:
+    """
+    Base class for scenario models
+    
+    Subclasses set SCENARIO_ID and the fred_client, crypto_provider and
+    onchain_provider attributes.
+    """
+    
+    # Provider and settings attributes live in slots for fast reads on every
+    # analysis; there is no __dict__, so tests patch methods on the class
+    __slots__ = (
+        'logger', 'settings', 'fred_client', 'crypto_provider', 'onchain_provider',
+        'signal_threshold', 'base_position_size', 'max_position_size'
+    )
+    
+    SCENARIO_ID = 0
+    
+    def analyze_result(self, portfolio_value: float = 100000,
+                       historical_date: Optional[datetime] = None) -> ScenarioResult:
+        """
+        Run the analysis and return it as a flat ScenarioResult
+        
+        Args:
+            portfolio_value: Total portfolio value for position sizing
+            historical_date: Optional date for historical analysis
+            
+        Returns:
+            ScenarioResult for this scenario
+        """
+        return ScenarioResult.from_result(self.analyze(portfolio_value, historical_date))
+    
+    async def _prefetch_async(self):
+        """Fetch the series analyze() reads into the provider caches (overridden per scenario)"""
+    
+    async def analyze_async(self, portfolio_value: float = 100000,
+                            historical_date: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        Run the analysis from an event loop
+        
+        The scenario's FRED series are fetched concurrently on the client's
+        aiohttp session first, so the analysis itself only reads cached data.
+        It then runs in the loop's default executor, which keeps the event loop
+        responsive even if a fetch has to be retried synchronously.
+        
+        Args:
+            portfolio_value: Total portfolio value for position sizing
+            historical_date: Optional date for historical analysis
+            
+        Returns:
+            Complete analysis results, as from analyze()
+        """
+        await self._prefetch_async()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.analyze, portfolio_value, historical_date)
+    
+    def health_check(self) -> Dict[str, Any]:
+        """
+        Check health of all data providers
+        
+        Returns:
+            Health status dictionary
+        """
+        health = {
+            'scenario': self.SCENARIO_ID,
+            'timestamp': now_iso(),
+            'providers': {}
+        }
+        
+        # Check FRED client and crypto providers concurrently
+        providers = {
+            'fred': self.fred_client,
+            'crypto': self.crypto_provider,
+            'onchain': self.onchain_provider
+        }
+        futures = {name: IO_POOL.submit(provider.health_check)
+                   for name, provider in providers.items()}
+        for name, future in futures.items():
+            health['providers'][name] = future.result()
+        
+        # Overall status
+        statuses = [provider.get('status') for provider in health['providers'].values()]
+        if all(status == 'healthy' for status in statuses):
+            health['status'] = 'healthy'
+        elif any(status == 'error' for status in statuses):
+            health['status'] = 'error'
+        else:
+            health['status'] = 'degraded'
+        
+        return health
@@ -6,16 +6,67 @@ This model identifies high-probability Bitcoin entry points when:
 2. Bitcoin exchange reserves are at multi-year lows
 """
 
+import asyncio
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime
+from enum import IntEnum
 from typing import Dict, Any, Optional
-import pandas as pd
 
 from ..data_providers.fred_client import FREDClient
-from ..data_providers.crypto_data import DataProviderFactory
-from ..config.settings import Settings
+from ..data_providers.crypto_data import DataProviderFactory, CoinGeckoClient, MockOnChainDataProvider
+from ..config.settings import get_settings
+from ..utils.time_utils import now_iso
+from ._executors import IO_POOL
+from .base import ScenarioModel, frozen_split
 
-class FedPivotModel:
+class PivotDirection(IntEnum):
+    """Fed policy direction as an integer code for the scoring math"""
+    NEUTRAL = 0
+    CUTTING = 1
+    HIKING = 2
+    
+    @classmethod
+    def from_label(cls, label) -> 'PivotDirection':
+        """Convert a direction label such as 'cutting' (unknown labels are neutral)"""
+        if isinstance(label, cls):
+            return label
+        return _PIVOT_DIRECTION_LABELS.get(label, cls.NEUTRAL)
+
+_PIVOT_DIRECTION_LABELS = {direction.name.lower(): direction for direction in PivotDirection}
+
+def _fed_score(base_score: float, pivot_detected: bool, pivot_direction: int,
+               pivot_magnitude: float) -> float:
+    """
+    Scale the rate-level base score by the policy direction
+    
+    Args:
+        base_score: Score for the current rate level
+        pivot_detected: Whether a policy pivot was detected
+        pivot_direction: PivotDirection code
+        pivot_magnitude: Size of the rate change in percentage points
+        
+    Returns:
+        Fed signal score (0-1)
+    """
+    direction_multiplier = 1.0
+    
+    if pivot_detected:
+        if pivot_direction == PivotDirection.CUTTING:
+            # Rate cuts are bullish
+            cut_bonus = pivot_magnitude / 2.0
+            direction_multiplier = 1.5 + (cut_bonus if cut_bonus < 0.5 else 0.5)
+        elif pivot_direction == PivotDirection.HIKING:
+            # Rate hikes are bearish
+            direction_multiplier = 0.3
+    elif pivot_direction == PivotDirection.CUTTING:
+        # Ongoing cuts without pivot detection
+        direction_multiplier = 1.2
+    
+    # Clamp with a comparison rather than a min() call
+    score = base_score * direction_multiplier
+    return score if score < 1.0 else 1.0
+
+class FedPivotModel(ScenarioModel):
     """
     Scenario 1: Fed Pivot + Low Exchange Reserves
     
@@ -23,20 +74,61 @@ class FedPivotModel:
     to identify strategic entry opportunities.
     """
     
-    def __init__(self, api_keys: Dict[str, str]):
+    __slots__ = ()
+    
+    SCENARIO_ID = 1
+    
+    # Signal scores for each classified level
+    RESERVE_LEVEL_SCORES = {
+        'critical_low': 1.0,
+        'low': 0.7,
+        'normal': 0.4,
+        'high': 0.2,
+        'critical_high': 0.0
+    }
+    
+    FED_RATE_LEVEL_SCORES = {
+        'ultra_low': 0.8,
+        'low': 0.5,
+        'neutral': 0.3,
+        'high': 0.1
+    }
+    
+    # Scaled entry over 72 hours: (timing, share of the position) for each step
+    ENTRY_TEMPLATE = (
+        ('immediate', 0.40),
+        ('24_hours', 0.30),
+        ('48_hours', 0.20),
+        ('72_hours', 0.10)
+    )
+    ENTRY_SPLIT = frozen_split(ENTRY_TEMPLATE)
+    
+    def __init__(self, api_keys: Dict[str, str],
+                 fred_client: Optional[FREDClient] = None,
+                 crypto_provider: Optional[CoinGeckoClient] = None,
+                 onchain_provider: Optional[MockOnChainDataProvider] = None):
         """
         Initialize Fed Pivot model
         
         Args:
             api_keys: Dictionary containing API keys for data providers
+            fred_client: Optional FRED client to share with other models
+            crypto_provider: Optional crypto price provider to share with other models
+            onchain_provider: Optional on-chain provider to share with other models
         """
         self.logger = logging.getLogger(__name__)
-        self.settings = Settings()
+        self.settings = get_settings()
         
-        # Initialize data providers
-        self.fred_client = FREDClient(api_keys.get('fred'))
-        self.crypto_provider = DataProviderFactory.create_crypto_provider(api_keys)
-        self.onchain_provider = DataProviderFactory.create_onchain_provider(api_keys)
+        # Static settings used on every analysis, read once
+        self.signal_threshold = self.settings.get_signal_threshold(1)  # Scenario 1
+        position_limits = self.settings.get_position_limits()
+        self.base_position_size = position_limits['base']
+        self.max_position_size = position_limits['max']
+        
+        # Initialize data providers; shared clients also share their response caches
+        self.fred_client = fred_client or FREDClient(api_keys.get('fred'))
+        self.crypto_provider = crypto_provider or DataProviderFactory.create_crypto_provider(api_keys)
+        self.onchain_provider = onchain_provider or DataProviderFactory.create_onchain_provider(api_keys)
         
         self.logger.info("FedPivotModel initialized")
     
@@ -48,14 +140,15 @@ class FedPivotModel:
             Dictionary with Fed policy metrics
         """
         try:
-            # Get current Fed funds rate
-            current_rate = self.fred_client.get_current_fed_rate()
+            # Get M2 for QE context from its own series in the background
+            m2_future = IO_POOL.submit(self.fred_client.get_m2_growth_rate)
             
-            # Detect policy pivot
+            # Current rate and pivot share one Fed funds window, so fetching
+            # them in turn makes the pivot lookup a cache hit
+            current_rate = self.fred_client.get_current_fed_rate()
             pivot_info = self.fred_client.detect_fed_pivot()
             
-            # Get M2 for QE context
-            m2_growth = self.fred_client.get_m2_growth_rate()
+            m2_growth = m2_future.result()
             
             return {
                 'fed_funds_rate': current_rate,
@@ -64,7 +157,7 @@ class FedPivotModel:
                 'pivot_magnitude': pivot_info.get('magnitude', 0),
                 'trend_change': pivot_info.get('trend_change', 0),
                 'm2_growth_rate': m2_growth,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': now_iso()
             }
         except Exception as e:
             self.logger.error(f"Failed to get Fed data: {str(e)}")
@@ -74,6 +167,15 @@ class FedPivotModel:
                 'error': str(e)
             }
     
+    async def _prefetch_async(self):
+        """Fetch the Fed funds and M2 series get_fed_data reads, concurrently"""
+        # Failures are left for get_fed_data to retry and report
+        await asyncio.gather(
+            self.fred_client.aget_fed_funds_values(),
+            self.fred_client.aget_m2_values(months_back=FREDClient.M2_LOOKBACK_MONTHS),
+            return_exceptions=True
+        )
+    
     def get_exchange_reserves(self) -> Dict[str, Any]:
         """
         Get Bitcoin exchange reserve data
@@ -88,29 +190,14 @@ class FedPivotModel:
                 return {'exchange_reserves': None, 'error': 'No reserve data available'}
             
             # Classify reserve level
-            thresholds = self.settings.EXCHANGE_RESERVE_THRESHOLDS
-            
-            if reserves < thresholds['critical_low']:
-                level = 'critical_low'
-                score = 1.0
-            elif reserves < thresholds['low']:
-                level = 'low'
-                score = 0.7
-            elif reserves > thresholds['critical_high']:
-                level = 'critical_high'
-                score = 0.0
-            elif reserves > thresholds['high']:
-                level = 'high'
-                score = 0.2
-            else:
-                level = 'normal'
-                score = 0.4
+            level = self.settings.classify_exchange_reserves(reserves)
+            score = self.RESERVE_LEVEL_SCORES[level]
             
             return {
                 'exchange_reserves': reserves,
                 'reserve_level': level,
                 'reserve_score': score,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': now_iso()
             }
         except Exception as e:
             self.logger.error(f"Failed to get exchange reserves: {str(e)}")
@@ -138,36 +225,14 @@ class FedPivotModel:
         pivot_magnitude = fed_data.get('pivot_magnitude', 0)
         
         # Base score from rate level
-        thresholds = self.settings.FED_RATE_THRESHOLDS
-        if current_rate < thresholds['ultra_low']:
-            base_score = 0.8
-        elif current_rate < thresholds['low']:
-            base_score = 0.5
-        elif current_rate < thresholds['neutral']:
-            base_score = 0.3
-        else:
-            base_score = 0.1
-        
-        # Pivot adjustments
-        direction_multiplier = 1.0
+        base_score = self.FED_RATE_LEVEL_SCORES[self.settings.classify_fed_rate(current_rate)]
         
-        if pivot_detected:
-            if pivot_direction == 'cutting':
-                # Rate cuts are bullish
-                direction_multiplier = 1.5 + min(0.5, pivot_magnitude / 2.0)
-            elif pivot_direction == 'hiking':
-                # Rate hikes are bearish
-                direction_multiplier = 0.3
-        elif pivot_direction == 'cutting':
-            # Ongoing cuts without pivot detection
-            direction_multiplier = 1.2
+        # Pivot adjustments and final score
+        score = _fed_score(base_score, pivot_detected,
+                           PivotDirection.from_label(pivot_direction), pivot_magnitude)
         
-        # Calculate final score
-        score = min(1.0, base_score * direction_multiplier)
-        
-        self.logger.debug(f"Fed score calculation: rate={current_rate}, "
-                         f"pivot={pivot_detected}, direction={pivot_direction}, "
-                         f"score={score:.3f}")
+        self.logger.debug("Fed score calculation: rate=%s, pivot=%s, direction=%s, score=%.3f",
+                          current_rate, pivot_detected, pivot_direction, score)
         
         return score
     
@@ -191,18 +256,11 @@ class FedPivotModel:
         combined_score = (fed_score * 0.6) + (reserve_score * 0.4)
         
         # Signal threshold
-        threshold = self.settings.get_signal_threshold(1)  # Scenario 1
+        threshold = self.signal_threshold
         buy_signal = combined_score >= threshold
         
         # Signal strength classification
-        if combined_score >= 0.8:
-            strength = 'very_strong'
-        elif combined_score >= 0.6:
-            strength = 'strong'
-        elif combined_score >= 0.4:
-            strength = 'moderate'
-        else:
-            strength = 'weak'
+        strength = self.settings.classify_signal_strength(combined_score)
         
         return {
             'fed_score': fed_score,
@@ -234,11 +292,10 @@ class FedPivotModel:
         
         # Calculate position size based on signal strength
         combined_score = signal_data['combined_score']
-        position_limits = self.settings.get_position_limits()
         
         # Scale position size with signal strength
-        base_size = position_limits['base']
-        max_size = position_limits['max']
+        base_size = self.base_position_size
+        max_size = self.max_position_size
         
         # Linear scaling based on signal strength above threshold
         threshold = signal_data['threshold']
@@ -254,11 +311,10 @@ class FedPivotModel:
         position_value = portfolio_value * position_size
         
         # Entry strategy (scaled over 72 hours)
+        values = (position_value * self.ENTRY_SPLIT).tolist()
         entry_plan = [
-            {'timing': 'immediate', 'percentage': 0.40, 'value': position_value * 0.40},
-            {'timing': '24_hours', 'percentage': 0.30, 'value': position_value * 0.30},
-            {'timing': '48_hours', 'percentage': 0.20, 'value': position_value * 0.20},
-            {'timing': '72_hours', 'percentage': 0.10, 'value': position_value * 0.10}
+            {'timing': timing, 'percentage': percentage, 'value': value}
+            for (timing, percentage), value in zip(self.ENTRY_TEMPLATE, values)
         ]
         
         return {
@@ -291,9 +347,14 @@ class FedPivotModel:
         """
         self.logger.info("Running Fed Pivot + Exchange Reserves analysis")
         
-        # Get data
+        # One timestamp for the whole run, so the result is stamped coherently
+        timestamp = now_iso()
+        
+        # Get data; the providers are independent, so fetch reserves in the
+        # background while the Fed data (which uses the pool itself) runs here
+        reserve_future = IO_POOL.submit(self.get_exchange_reserves)
         fed_data = self.get_fed_data()
-        reserve_data = self.get_exchange_reserves()
+        reserve_data = reserve_future.result()
         
         # Calculate signals
         signals = self.calculate_signal_strength(fed_data, reserve_data)
@@ -311,41 +372,10 @@ class FedPivotModel:
             },
             'signals': signals,
             'trade_plan': trade_plan,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': timestamp
         }
         
-        self.logger.info(f"Analysis complete. Buy signal: {signals['buy_signal']}, "
-                        f"Score: {signals['combined_score']:.3f}")
+        self.logger.info("Analysis complete. Buy signal: %s, Score: %.3f",
+                         signals['buy_signal'], signals['combined_score'])
         
         return result
-    
-    def health_check(self) -> Dict[str, Any]:
-        """
-        Check health of all data providers
-        
-        Returns:
-            Health status dictionary
-        """
-        health = {
-            'scenario': 1,
-            'timestamp': datetime.now().isoformat(),
-            'providers': {}
-        }
-        
-        # Check FRED client
-        health['providers']['fred'] = self.fred_client.health_check()
-        
-        # Check crypto providers
-        health['providers']['crypto'] = self.crypto_provider.health_check()
-        health['providers']['onchain'] = self.onchain_provider.health_check()
-        
-        # Overall status
-        statuses = [provider.get('status') for provider in health['providers'].values()]
-        if all(status == 'healthy' for status in statuses):
-            health['status'] = 'healthy'
-        elif any(status == 'error' for status in statuses):
-            health['status'] = 'error'
-        else:
-            health['status'] = 'degraded'
-        
-        return health
\ No newline at end of file
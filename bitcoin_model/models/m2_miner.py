@@ -7,15 +7,56 @@ This model identifies strategic Bitcoin accumulation opportunities when:
 """
 
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime
+from enum import IntEnum
 from typing import Dict, Any, Optional
-import pandas as pd
 
 from ..data_providers.fred_client import FREDClient
-from ..data_providers.crypto_data import DataProviderFactory
-from ..config.settings import Settings
+from ..data_providers.crypto_data import DataProviderFactory, CoinGeckoClient, MockOnChainDataProvider
+from ..config.settings import get_settings
+from ..utils.time_utils import now_iso
+from ._executors import IO_POOL
+from .base import ScenarioModel, frozen_split
 
-class M2MinerModel:
+class RibbonSignal(IntEnum):
+    """Hash ribbon signal as an integer code"""
+    SELL = -1
+    NEUTRAL = 0
+    BUY = 1
+    
+    @classmethod
+    def from_label(cls, label) -> 'RibbonSignal':
+        """Convert a provider signal label such as 'buy' (unknown labels are neutral)"""
+        if isinstance(label, cls):
+            return label
+        return _RIBBON_SIGNAL_LABELS.get(label, cls.NEUTRAL)
+
+_RIBBON_SIGNAL_LABELS = {signal.name.lower(): signal for signal in RibbonSignal}
+
+def _m2_score(base_score: float, acceleration: float) -> float:
+    """
+    Adjust the M2 growth-level base score for growth acceleration
+    
+    Args:
+        base_score: Score for the current M2 growth level
+        acceleration: Change in YoY growth over recent months
+        
+    Returns:
+        M2 signal score (0-1)
+    """
+    # Positive acceleration (increasing growth) is bullish; bonus is clamped to
+    # +/-0.2 with comparisons rather than min()/max() calls
+    accel_bonus = acceleration * 5
+    accel_bonus = -0.2 if accel_bonus < -0.2 else 0.2 if accel_bonus > 0.2 else accel_bonus
+    
+    # TODO: Add velocity adjustment when GDP data is available
+    # Lower velocity (money sitting idle) is bullish for Bitcoin
+    velocity_adjustment = 0.0
+    
+    score = base_score + accel_bonus + velocity_adjustment
+    return 0.0 if score < 0.0 else 1.0 if score > 1.0 else score
+
+class M2MinerModel(ScenarioModel):
     """
     Scenario 2: M2 Expansion + Miner Capitulation
     
@@ -23,20 +64,61 @@ class M2MinerModel:
     dynamics to identify strategic accumulation periods.
     """
     
-    def __init__(self, api_keys: Dict[str, str]):
+    __slots__ = ()
+    
+    SCENARIO_ID = 2
+    
+    # Signal scores for each classified M2 growth level
+    M2_LEVEL_SCORES = {
+        'extreme_expansion': 1.0,
+        'strong_expansion': 0.8,
+        'normal_expansion': 0.5,
+        'slow_growth': 0.2,
+        'contraction': 0.0
+    }
+    
+    # (score, strength) for each hash ribbon signal
+    RIBBON_SIGNAL_SCORES = {
+        RibbonSignal.BUY: (1.0, 'strong_buy'),
+        RibbonSignal.SELL: (0.0, 'strong_sell'),
+        RibbonSignal.NEUTRAL: (0.4, 'neutral')
+    }
+    
+    # Accumulation over 30 days: (timing, share of the position) for each week
+    ENTRY_TEMPLATE = (
+        ('week_1', 0.30),
+        ('week_2', 0.25),
+        ('week_3', 0.25),
+        ('week_4', 0.20)
+    )
+    ENTRY_SPLIT = frozen_split(ENTRY_TEMPLATE)
+    
+    def __init__(self, api_keys: Dict[str, str],
+                 fred_client: Optional[FREDClient] = None,
+                 crypto_provider: Optional[CoinGeckoClient] = None,
+                 onchain_provider: Optional[MockOnChainDataProvider] = None):
         """
         Initialize M2 Miner model
         
         Args:
             api_keys: Dictionary containing API keys for data providers
+            fred_client: Optional FRED client to share with other models
+            crypto_provider: Optional crypto price provider to share with other models
+            onchain_provider: Optional on-chain provider to share with other models
         """
         self.logger = logging.getLogger(__name__)
-        self.settings = Settings()
+        self.settings = get_settings()
         
-        # Initialize data providers
-        self.fred_client = FREDClient(api_keys.get('fred'))
-        self.crypto_provider = DataProviderFactory.create_crypto_provider(api_keys)
-        self.onchain_provider = DataProviderFactory.create_onchain_provider(api_keys)
+        # Static settings used on every analysis, read once
+        self.signal_threshold = self.settings.get_signal_threshold(2)  # Scenario 2
+        position_limits = self.settings.get_position_limits()
+        self.base_position_size = position_limits['base']
+        self.max_position_size = position_limits['max']
+        
+        # Initialize data providers; shared clients also share their response caches
+        self.fred_client = fred_client or FREDClient(api_keys.get('fred'))
+        self.crypto_provider = crypto_provider or DataProviderFactory.create_crypto_provider(api_keys)
+        self.onchain_provider = onchain_provider or DataProviderFactory.create_onchain_provider(api_keys)
         
         self.logger.info("M2MinerModel initialized")
     
@@ -48,51 +130,29 @@ class M2MinerModel:
             Dictionary with M2 metrics
         """
         try:
-            # Get M2 growth rate
-            m2_growth = self.fred_client.get_m2_growth_rate()
+            # One M2 fetch serves both the growth rate and the acceleration
+            values = self.fred_client.get_m2_values(months_back=FREDClient.M2_LOOKBACK_MONTHS)
             
-            if m2_growth is None:
+            n = len(values)
+            if n < 13:
                 return {'m2_growth_rate': None, 'error': 'M2 data unavailable'}
             
-            # Get detailed M2 data for acceleration calculation
-            m2_df = self.fred_client.get_m2_money_supply(months_back=18)
+            # Year-over-year growth (12 monthly observations back)
+            m2_growth = float((values[-1] - values[-13]) / values[-13])
             
             m2_acceleration = None
             m2_velocity = None
             
-            if len(m2_df) >= 24:  # Need at least 2 years of data
-                # Calculate acceleration (change in growth rate)
-                recent_growth = []
-                for i in range(3):  # Last 3 months
-                    if len(m2_df) > (13 + i):
-                        current = m2_df.iloc[-(1+i)]['value']
-                        year_ago = m2_df.iloc[-(13+i)]['value']
-                        growth = (current - year_ago) / year_ago
-                        recent_growth.append(growth)
-                
-                if len(recent_growth) >= 2:
-                    current_growth = recent_growth[0]
-                    prev_growth = recent_growth[-1]
-                    m2_acceleration = current_growth - prev_growth
+            if n >= 24:  # Need at least 2 years of data
+                # Calculate acceleration (change in growth rate over the last 3 months)
+                recent = values[-3:]
+                year_ago = values[-15:-12]
+                growth = (recent - year_ago) / year_ago
+                m2_acceleration = float(growth[-1] - growth[0])
             
             # Classify M2 growth level
-            thresholds = self.settings.M2_THRESHOLDS
-            
-            if m2_growth >= thresholds['extreme_expansion']:
-                growth_level = 'extreme_expansion'
-                growth_score = 1.0
-            elif m2_growth >= thresholds['strong_expansion']:
-                growth_level = 'strong_expansion'
-                growth_score = 0.8
-            elif m2_growth >= thresholds['normal_expansion']:
-                growth_level = 'normal_expansion'
-                growth_score = 0.5
-            elif m2_growth >= thresholds['contraction']:
-                growth_level = 'slow_growth'
-                growth_score = 0.2
-            else:
-                growth_level = 'contraction'
-                growth_score = 0.0
+            growth_level = self.settings.classify_m2_growth(m2_growth)
+            growth_score = self.M2_LEVEL_SCORES[growth_level]
             
             return {
                 'm2_growth_rate': m2_growth,
@@ -100,7 +160,7 @@ class M2MinerModel:
                 'm2_velocity': m2_velocity,  # TODO: Calculate from GDP data
                 'growth_level': growth_level,
                 'growth_score': growth_score,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': now_iso()
             }
         except Exception as e:
             self.logger.error(f"Failed to get M2 data: {str(e)}")
@@ -109,6 +169,14 @@ class M2MinerModel:
                 'error': str(e)
             }
     
+    async def _prefetch_async(self):
+        """Fetch the M2 series get_m2_data reads"""
+        try:
+            await self.fred_client.aget_m2_values(months_back=FREDClient.M2_LOOKBACK_MONTHS)
+        except Exception as e:
+            # Left for get_m2_data to retry and report
+            self.logger.debug("M2 prefetch failed: %s", e)
+    
     def get_hash_ribbon_data(self) -> Dict[str, Any]:
         """
         Get Bitcoin hash ribbon and miner capitulation data
@@ -126,16 +194,8 @@ class M2MinerModel:
             signal = hash_data.get('signal', 'neutral')
             miner_capitulation = hash_data.get('miner_capitulation', False)
             
-            # Score based on hash ribbon signal
-            if signal == 'buy':
-                ribbon_score = 1.0
-                signal_strength = 'strong_buy'
-            elif signal == 'sell':
-                ribbon_score = 0.0
-                signal_strength = 'strong_sell'
-            else:  # neutral
-                ribbon_score = 0.4
-                signal_strength = 'neutral'
+            # Score based on hash ribbon signal, converted once at the provider boundary
+            ribbon_score, signal_strength = self.RIBBON_SIGNAL_SCORES[RibbonSignal.from_label(signal)]
             
             # Bonus for post-capitulation recovery
             capitulation_bonus = 0.3 if miner_capitulation else 0.0
@@ -150,7 +210,7 @@ class M2MinerModel:
                 'ma_30': hash_data.get('ma_30'),
                 'ma_60': hash_data.get('ma_60'),
                 'trend': hash_data.get('trend', 'unknown'),
-                'timestamp': datetime.now().isoformat()
+                'timestamp': now_iso()
             }
         except Exception as e:
             self.logger.error(f"Failed to get hash ribbon data: {str(e)}")
@@ -176,20 +236,11 @@ class M2MinerModel:
         acceleration = m2_data.get('m2_acceleration', 0)
         base_score = m2_data.get('growth_score', 0)
         
-        # Acceleration adjustment
-        accel_bonus = 0.0
-        if acceleration is not None:
-            # Positive acceleration (increasing growth) is bullish
-            accel_bonus = min(0.2, max(-0.2, acceleration * 5))
-        
-        # TODO: Add velocity adjustment when GDP data is available
-        # Lower velocity (money sitting idle) is bullish for Bitcoin
-        velocity_adjustment = 0.0
+        # Acceleration adjustment (missing acceleration counts as none)
+        final_score = _m2_score(base_score, acceleration or 0.0)
         
-        final_score = min(1.0, max(0.0, base_score + accel_bonus + velocity_adjustment))
-        
-        self.logger.debug(f"M2 score calculation: growth={growth_rate:.3f}, "
-                         f"accel={acceleration}, score={final_score:.3f}")
+        self.logger.debug("M2 score calculation: growth=%.3f, accel=%s, score=%.3f",
+                          growth_rate, acceleration, final_score)
         
         return final_score
     
@@ -213,18 +264,11 @@ class M2MinerModel:
         combined_score = (m2_score * 0.5) + (miner_score * 0.5)
         
         # Signal threshold (higher than Scenario 1 - requires more conviction)
-        threshold = self.settings.get_signal_threshold(2)  # Scenario 2
+        threshold = self.signal_threshold
         buy_signal = combined_score >= threshold
         
         # Signal strength classification
-        if combined_score >= 0.8:
-            strength = 'very_strong'
-        elif combined_score >= 0.6:
-            strength = 'strong'
-        elif combined_score >= 0.4:
-            strength = 'moderate'
-        else:
-            strength = 'weak'
+        strength = self.settings.classify_signal_strength(combined_score)
         
         # Special case: Extreme M2 expansion can override miner signals
         if m2_data.get('growth_level') == 'extreme_expansion':
@@ -262,11 +306,10 @@ class M2MinerModel:
         
         # Calculate position size based on signal strength
         combined_score = signal_data['combined_score']
-        position_limits = self.settings.get_position_limits()
         
         # Scale position size with signal strength
-        base_size = position_limits['base']
-        max_size = position_limits['max']
+        base_size = self.base_position_size
+        max_size = self.max_position_size
         
         # More aggressive sizing for M2 scenario due to longer timeframes
         threshold = signal_data['threshold']
@@ -282,11 +325,10 @@ class M2MinerModel:
         position_value = portfolio_value * position_size
         
         # Entry strategy (accumulated over 30 days for M2 scenario)
+        values = (position_value * self.ENTRY_SPLIT).tolist()
         entry_plan = [
-            {'timing': 'week_1', 'percentage': 0.30, 'value': position_value * 0.30},
-            {'timing': 'week_2', 'percentage': 0.25, 'value': position_value * 0.25},
-            {'timing': 'week_3', 'percentage': 0.25, 'value': position_value * 0.25},
-            {'timing': 'week_4', 'percentage': 0.20, 'value': position_value * 0.20}
+            {'timing': timing, 'percentage': percentage, 'value': value}
+            for (timing, percentage), value in zip(self.ENTRY_TEMPLATE, values)
         ]
         
         return {
@@ -320,9 +362,14 @@ class M2MinerModel:
         """
         self.logger.info("Running M2 Expansion + Miner Capitulation analysis")
         
-        # Get data
+        # One timestamp for the whole run, so the result is stamped coherently
+        timestamp = now_iso()
+        
+        # Get data; the providers are independent, so fetch miner data in the
+        # background while M2 is fetched here
+        miner_future = IO_POOL.submit(self.get_hash_ribbon_data)
         m2_data = self.get_m2_data()
-        miner_data = self.get_hash_ribbon_data()
+        miner_data = miner_future.result()
         
         # Calculate signals
         signals = self.calculate_signal_strength(m2_data, miner_data)
@@ -340,41 +387,10 @@ class M2MinerModel:
             },
             'signals': signals,
             'trade_plan': trade_plan,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': timestamp
         }
         
-        self.logger.info(f"Analysis complete. Buy signal: {signals['buy_signal']}, "
-                        f"Score: {signals['combined_score']:.3f}")
+        self.logger.info("Analysis complete. Buy signal: %s, Score: %.3f",
+                         signals['buy_signal'], signals['combined_score'])
         
         return result
-    
-    def health_check(self) -> Dict[str, Any]:
-        """
-        Check health of all data providers
-        
-        Returns:
-            Health status dictionary
-        """
-        health = {
-            'scenario': 2,
-            'timestamp': datetime.now().isoformat(),
-            'providers': {}
-        }
-        
-        # Check FRED client
-        health['providers']['fred'] = self.fred_client.health_check()
-        
-        # Check crypto providers
-        health['providers']['crypto'] = self.crypto_provider.health_check()
-        health['providers']['onchain'] = self.onchain_provider.health_check()
-        
-        # Overall status
-        statuses = [provider.get('status') for provider in health['providers'].values()]
-        if all(status == 'healthy' for status in statuses):
-            health['status'] = 'healthy'
-        elif any(status == 'error' for status in statuses):
-            health['status'] = 'error'
-        else:
-            health['status'] = 'degraded'
-        
-        return health
\ No newline at end of file
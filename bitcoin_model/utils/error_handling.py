@@ -2,20 +2,40 @@
 Error handling utilities for Bitcoin Strategic Investment Model
 """
 
+import asyncio
 import functools
+import itertools
 import logging
-from typing import Any, Callable, Dict, Optional
+import random
+import re
+import time
+from collections import Counter, deque
+from typing import Any, Callable, Dict, List, Optional
 from datetime import datetime
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Scalar types accepted by the validators, including NumPy scalars
+_NUMERIC = (int, float, np.integer, np.floating)
+
 class BSIError(Exception):
     """Base exception for BSI Model errors"""
     pass
 
 class DataProviderError(BSIError):
-    """Error related to data provider issues"""
-    pass
+    """
+    Error related to data provider issues
+    
+    Args:
+        message: Error description
+        retry_after: Seconds the provider asked us to wait before retrying
+                     (from a Retry-After header), if known
+    """
+    
+    def __init__(self, message: str = "", retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
 
 class SignalCalculationError(BSIError):
     """Error in signal calculation"""
@@ -29,37 +49,73 @@ class ConfigurationError(BSIError):
     """Error in configuration"""
     pass
 
+def _retry_delay(attempt: int, delay: float, backoff: float,
+                 jitter: float, max_delay: float) -> float:
+    """Exponential backoff with proportional random jitter, capped at max_delay"""
+    return min(delay * backoff ** attempt * (1 + random.random() * jitter), max_delay)
+
 def retry_on_exception(max_retries: int = 3, 
                       delay: float = 1.0,
-                      exceptions: tuple = (Exception,)):
+                      exceptions: tuple = (Exception,),
+                      backoff: float = 2.0,
+                      jitter: float = 0.5,
+                      max_delay: float = 30.0):
     """
     Decorator to retry function calls on specific exceptions
     
+    Works on both plain functions and coroutine functions; coroutines wait
+    with asyncio.sleep so retries don't block the event loop. If the exception
+    carries a retry_after (e.g. a rate-limited DataProviderError), the wait is
+    at least that long.
+    
     Args:
         max_retries: Maximum number of retry attempts
-        delay: Delay between retries in seconds
+        delay: Delay before the first retry in seconds
         exceptions: Tuple of exceptions to catch and retry on
+        backoff: Multiplier applied to the delay after each failed attempt
+        jitter: Maximum random fraction added to each delay, so concurrent
+                callers don't retry in lockstep
+        max_delay: Upper bound on any single delay in seconds
     """
+    def log_failure(func: Callable, attempt: int, error: Exception) -> Optional[float]:
+        """Log a failed attempt and return the delay before the next one, or None"""
+        if attempt < max_retries:
+            wait = _retry_delay(attempt, delay, backoff, jitter, max_delay)
+            retry_after = getattr(error, 'retry_after', None)
+            if retry_after is not None:
+                wait = max(wait, retry_after)
+            logger.warning("Attempt %d failed for %s: %s. Retrying in %.2f seconds...",
+                           attempt + 1, func.__name__, error, wait)
+            return wait
+        
+        logger.error("All %d attempts failed for %s", max_retries + 1, func.__name__)
+        return None
+    
     def decorator(func: Callable) -> Callable:
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                for attempt in range(max_retries + 1):
+                    try:
+                        return await func(*args, **kwargs)
+                    except exceptions as e:
+                        wait = log_failure(func, attempt, e)
+                        if wait is None:
+                            raise
+                        await asyncio.sleep(wait)
+            
+            return async_wrapper
+        
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            import time
-            
-            last_exception = None
-            
             for attempt in range(max_retries + 1):
                 try:
                     return func(*args, **kwargs)
                 except exceptions as e:
-                    last_exception = e
-                    if attempt < max_retries:
-                        logger.warning(f"Attempt {attempt + 1} failed for {func.__name__}: {str(e)}. "
-                                     f"Retrying in {delay} seconds...")
-                        time.sleep(delay)
-                    else:
-                        logger.error(f"All {max_retries + 1} attempts failed for {func.__name__}")
-            
-            raise last_exception
+                    wait = log_failure(func, attempt, e)
+                    if wait is None:
+                        raise
+                    time.sleep(wait)
         
         return wrapper
     return decorator
@@ -78,14 +134,34 @@ def safe_division(numerator: float, denominator: float,
         Result of division or default value
     """
     try:
-        if denominator == 0:
-            logger.warning(f"Division by zero: {numerator} / {denominator}, returning {default}")
-            return default
-        return numerator / denominator
+        if denominator != 0:
+            return numerator / denominator
     except (TypeError, ValueError) as e:
-        logger.error(f"Error in division: {str(e)}, returning {default}")
+        logger.error("Error in division: %s, returning %s", e, default)
         return default
+    
+    logger.warning("Division by zero: %s / %s, returning %s", numerator, denominator, default)
+    return default
 
+def safe_div_array(numerator, denominator, default: float = 0.0) -> np.ndarray:
+    """
+    Element-wise safe division of two arrays
+    
+    Args:
+        numerator: Array-like of numbers to divide
+        denominator: Array-like of numbers to divide by
+        default: Value used wherever the denominator is zero
+        
+    Returns:
+        Float array of quotients, with default in place of division by zero
+    """
+    numerator, denominator = np.broadcast_arrays(np.asarray(numerator, dtype=np.float64),
+                                                 np.asarray(denominator, dtype=np.float64))
+    return np.divide(numerator, denominator,
+                     out=np.full(numerator.shape, default, dtype=np.float64),
+                     where=denominator != 0)
+
+@functools.singledispatch
 def validate_percentage(value: float, name: str = "value") -> float:
     """
     Validate that a value is a valid percentage (0-1)
@@ -100,7 +176,7 @@ def validate_percentage(value: float, name: str = "value") -> float:
     Raises:
         ValueError: If value is not between 0 and 1
     """
-    if not isinstance(value, (int, float)):
+    if type(value) is not float and not isinstance(value, _NUMERIC):
         raise ValueError(f"{name} must be a number, got {type(value)}")
     
     if not 0 <= value <= 1:
@@ -108,6 +184,29 @@ def validate_percentage(value: float, name: str = "value") -> float:
     
     return float(value)
 
+@validate_percentage.register(np.ndarray)
+def validate_percentage_array(values, name: str = "values") -> np.ndarray:
+    """
+    Validate that every element of an array is a valid percentage (0-1)
+    
+    Args:
+        values: Array-like of values to validate
+        name: Name of the values for error messages
+        
+    Returns:
+        Validated values as a float64 array
+        
+    Raises:
+        ValueError: If any value is not between 0 and 1
+    """
+    array = np.asarray(values, dtype=np.float64)
+    valid = (array >= 0.0) & (array <= 1.0)
+    if not valid.all():
+        raise ValueError(f"{name} must be between 0 and 1, got {array[~valid]}")
+    
+    return array
+
+@functools.singledispatch
 def validate_positive_number(value: float, name: str = "value") -> float:
     """
     Validate that a value is a positive number
@@ -122,7 +221,7 @@ def validate_positive_number(value: float, name: str = "value") -> float:
     Raises:
         ValueError: If value is not positive
     """
-    if not isinstance(value, (int, float)):
+    if type(value) is not float and not isinstance(value, _NUMERIC):
         raise ValueError(f"{name} must be a number, got {type(value)}")
     
     if value <= 0:
@@ -130,12 +229,65 @@ def validate_positive_number(value: float, name: str = "value") -> float:
     
     return float(value)
 
+@validate_positive_number.register(np.ndarray)
+def validate_positive_array(values, name: str = "values") -> np.ndarray:
+    """
+    Validate that every element of an array is a positive number
+    
+    Args:
+        values: Array-like of values to validate
+        name: Name of the values for error messages
+        
+    Returns:
+        Validated values as a float64 array
+        
+    Raises:
+        ValueError: If any value is not positive
+    """
+    array = np.asarray(values, dtype=np.float64)
+    valid = array > 0.0
+    if not valid.all():
+        raise ValueError(f"{name} must be positive, got {array[~valid]}")
+    
+    return array
+
 class ErrorTracker:
     """Track and analyze errors in the BSI system"""
     
-    def __init__(self):
-        self.errors = []
-        self.error_counts = {}
+    def __init__(self, maxlen: int = 10_000):
+        """
+        Initialize the tracker
+        
+        Args:
+            maxlen: Number of most recent error records kept; older records are
+                    dropped, though they still count towards the totals
+        """
+        # Records are stored column-wise in parallel ring buffers, so appends
+        # don't allocate a dict per error and the summary reads only the
+        # columns it reports
+        self._timestamps = deque(maxlen=maxlen)  # epoch seconds
+        self._error_types = deque(maxlen=maxlen)
+        self._messages = deque(maxlen=maxlen)
+        self._contexts = deque(maxlen=maxlen)
+        self._components = deque(maxlen=maxlen)
+        self.error_counts = Counter()  # (component, error type) -> count
+        self.total_errors = 0
+    
+    @property
+    def errors(self) -> List[Dict[str, Any]]:
+        """Retained error records, oldest first"""
+        return [
+            {
+                'timestamp': datetime.fromtimestamp(timestamp),
+                'error_type': error_type,
+                'message': message,
+                'context': context,
+                'component': component
+            }
+            for timestamp, error_type, message, context, component in zip(
+                self._timestamps, self._error_types, self._messages,
+                self._contexts, self._components)
+        ]
     
     def record_error(self, error: Exception, context: str = "", 
                     component: str = "unknown"):
@@ -147,21 +299,24 @@ class ErrorTracker:
             context: Additional context about when/where the error occurred
             component: System component where error occurred
         """
-        error_record = {
-            'timestamp': datetime.now(),
-            'error_type': type(error).__name__,
-            'message': str(error),
-            'context': context,
-            'component': component
-        }
+        error_type = type(error).__name__
+        message = str(error)
         
-        self.errors.append(error_record)
+        self._timestamps.append(time.time())
+        self._error_types.append(error_type)
+        self._messages.append(message)
+        self._contexts.append(context)
+        self._components.append(component)
+        self.total_errors += 1
         
         # Update error counts
-        error_key = f"{component}:{type(error).__name__}"
-        self.error_counts[error_key] = self.error_counts.get(error_key, 0) + 1
+        self.error_counts[(component, error_type)] += 1
         
-        logger.error(f"Error recorded - {error_key}: {str(error)} (Context: {context})")
+        logger.error("Error recorded - %s:%s: %s (Context: %s)",
+                     component, error_type, message, context,
+                     extra={'extra_fields': {'event': 'error_recorded', 'component': component,
+                                             'type': error_type, 'context': context,
+                                             'error': message}})
     
     def get_error_summary(self) -> Dict[str, Any]:
         """
@@ -170,34 +325,62 @@ class ErrorTracker:
         Returns:
             Dictionary with error statistics
         """
-        if not self.errors:
+        if not self._timestamps:
             return {'total_errors': 0, 'error_types': {}, 'recent_errors': []}
         
-        recent_errors = self.errors[-10:]  # Last 10 errors
+        # Last 10 errors, read from only the columns reported
+        start = max(0, len(self._timestamps) - 10)
+        recent = zip(*(itertools.islice(column, start, None) for column in
+                       (self._timestamps, self._error_types, self._messages, self._components)))
         
         return {
-            'total_errors': len(self.errors),
-            'error_types': self.error_counts.copy(),
+            'total_errors': self.total_errors,
+            'error_types': {f"{component}:{error_type}": count
+                            for (component, error_type), count in self.error_counts.items()},
             'recent_errors': [
                 {
-                    'timestamp': err['timestamp'].isoformat(),
-                    'type': err['error_type'],
-                    'message': err['message'],
-                    'component': err['component']
+                    'timestamp': datetime.fromtimestamp(timestamp).isoformat(),
+                    'type': error_type,
+                    'message': message,
+                    'component': component
                 }
-                for err in recent_errors
+                for timestamp, error_type, message, component in recent
             ]
         }
     
     def clear_errors(self):
         """Clear all recorded errors"""
-        self.errors.clear()
+        for column in (self._timestamps, self._error_types, self._messages,
+                       self._contexts, self._components):
+            column.clear()
         self.error_counts.clear()
+        self.total_errors = 0
         logger.info("Error tracking cleared")
 
 # Global error tracker instance
 error_tracker = ErrorTracker()
 
+# Keywords that classify API error messages, checked in a single scan of the
+# lowercased message. The pattern is a plain alternation of literals (no
+# nested quantifiers or backreferences), so matching stays linear in the
+# message length even for long provider payloads.
+_API_ERROR_PATTERN = re.compile(
+    r"(?P<network>timeout|connection|network)"
+    r"|(?P<auth>unauthorized|forbidden|api key)"
+    r"|(?P<rate_limit>rate limit|too many requests)"
+)
+
+def _retry_after_seconds(error: Exception) -> Optional[float]:
+    """Read a numeric Retry-After header from an HTTP error's response, if any"""
+    response = getattr(error, 'response', None)
+    headers = getattr(response, 'headers', None)
+    if not headers:
+        return None
+    try:
+        return float(headers.get('Retry-After'))
+    except (TypeError, ValueError):
+        return None
+
 def handle_api_error(func: Callable) -> Callable:
     """
     Decorator to handle API-related errors consistently
@@ -209,15 +392,17 @@ def handle_api_error(func: Callable) -> Callable:
         try:
             return func(*args, **kwargs)
         except Exception as e:
-            # Convert common errors to BSI-specific exceptions
-            error_message = str(e).lower()
+            # Convert common errors to BSI-specific exceptions; one scan finds
+            # every category present, then the highest-priority one wins
+            categories = {match.lastgroup for match in _API_ERROR_PATTERN.finditer(str(e).lower())}
             
-            if any(keyword in error_message for keyword in ['timeout', 'connection', 'network']):
+            if 'network' in categories:
                 raise DataProviderError(f"Network error in {func.__name__}: {str(e)}")
-            elif any(keyword in error_message for keyword in ['unauthorized', 'forbidden', 'api key']):
+            elif 'auth' in categories:
                 raise DataProviderError(f"Authentication error in {func.__name__}: {str(e)}")
-            elif any(keyword in error_message for keyword in ['rate limit', 'too many requests']):
-                raise DataProviderError(f"Rate limit error in {func.__name__}: {str(e)}")
+            elif 'rate_limit' in categories:
+                raise DataProviderError(f"Rate limit error in {func.__name__}: {str(e)}",
+                                        retry_after=_retry_after_seconds(e))
             else:
                 # Record the error and re-raise as DataProviderError
                 error_tracker.record_error(e, func.__name__, 'data_provider')
@@ -2,24 +2,145 @@
 Logging configuration for Bitcoin Strategic Investment Model
 """
 
+import atexit
+import copy
+import functools
 import logging
 import logging.handlers
 import os
+import queue
+import threading
 from datetime import datetime
 from typing import Optional
+import orjson
+
+# Background listener that performs the actual handler I/O for setup_logging
+_listener: Optional[logging.handlers.QueueListener] = None
+
+# File output is buffered and written in batches: when the buffer fills, on
+# any ERROR record, and at least every flush interval
+_FILE_BUFFER_CAPACITY = 1024
+_FILE_FLUSH_INTERVAL = 30.0  # seconds
+_flush_stop: Optional[threading.Event] = None
+
+# Arguments of the configuration currently installed by setup_logging
+_configured: Optional[tuple] = None
+
+def _flush_periodically(handler: logging.Handler, stop: threading.Event):
+    """Flush a buffering handler every _FILE_FLUSH_INTERVAL until stopped"""
+    while not stop.wait(_FILE_FLUSH_INTERVAL):
+        handler.flush()
+
+def _stop_listener():
+    """Stop the background listener, flushing any queued and buffered records"""
+    global _listener, _flush_stop, _configured
+    _configured = None
+    if _flush_stop is not None:
+        _flush_stop.set()
+        _flush_stop = None
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            target = getattr(handler, 'target', None)
+            handler.close()
+            if target is not None:
+                target.close()
+        _listener = None
+
+atexit.register(_stop_listener)
+
+class _FastRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """RotatingFileHandler that skips the per-record filesystem checks"""
+    
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        """
+        Determine if rollover should occur
+        
+        The stock handler stats the log path on every record; here the open
+        stream's position answers the common case, and only a record that would
+        reach maxBytes falls through to the full check.
+        """
+        if self.maxBytes <= 0:
+            return False
+        if self.stream is None:
+            self.stream = self._open()
+        msg = "%s\n" % self.format(record)
+        if self.stream.tell() + len(msg) < self.maxBytes:
+            return False
+        return super().shouldRollover(record)
+
+class JsonFormatter(logging.Formatter):
+    """
+    Format each record as a single-line JSON object
+    
+    Structured fields passed as extra={'extra_fields': {...}} are merged into
+    the object, so downstream log pipelines don't have to parse the message.
+    """
+    
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'ts': record.created,
+            'lvl': record.levelname,
+            'name': record.name,
+            'msg': record.getMessage(),
+            **getattr(record, 'extra_fields', {})
+        }
+        # Records from the queue carry their traceback pre-rendered in exc_text
+        exc_text = record.exc_text
+        if record.exc_info and not exc_text:
+            exc_text = self.formatException(record.exc_info)
+        if exc_text:
+            entry['exc'] = exc_text
+        return orjson.dumps(entry, default=str).decode()
+
+# Formatters are stateless, so one instance of each is shared by all handlers
+_TEXT_FORMATTER = logging.Formatter(
+    fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+_JSON_FORMATTER = JsonFormatter()
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that leaves record formatting to the listener's handlers"""
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Snapshot a record for the queue
+        
+        The stock prepare formats the whole record into msg, which hides the
+        traceback from JsonFormatter. Only the message arguments and traceback
+        are resolved here, while they are still current; the handler's own
+        formatter does the rest on the listener thread.
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = _TEXT_FORMATTER.formatException(record.exc_info)
+            record.exc_info = None
+        return record
 
 def setup_logging(log_level: str = "INFO", 
                  log_file: Optional[str] = None,
                  max_file_size: int = 10 * 1024 * 1024,  # 10MB
-                 backup_count: int = 5) -> logging.Logger:
+                 backup_count: int = 5,
+                 json_format: bool = False) -> logging.Logger:
     """
     Setup logging configuration for the BSI model
     
+    Log calls resolve the message and any traceback on the calling thread and
+    enqueue the record; formatting and console/file output happen on a
+    background listener thread, so a slow terminal or log disk doesn't stall
+    the caller. Calling it again with the same arguments keeps
+    the existing configuration instead of reopening the handlers.
+    
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Optional log file path
         max_file_size: Maximum log file size in bytes
         backup_count: Number of backup log files to keep
+        json_format: Write one JSON object per record instead of plain text
         
     Returns:
         Configured logger instance
@@ -27,22 +148,27 @@ def setup_logging(log_level: str = "INFO",
     
     # Create logger
     logger = logging.getLogger('bitcoin_model')
-    logger.setLevel(getattr(logging, log_level.upper()))
+    level = getattr(logging, log_level.upper())
     
-    # Clear any existing handlers
+    # Already configured this way
+    global _configured
+    config = (level, log_file, max_file_size, backup_count, json_format)
+    if config == _configured:
+        return logger
+    
+    logger.setLevel(level)
+    
+    # Clear any existing handlers (and the listener feeding them)
+    _stop_listener()
     logger.handlers.clear()
     
-    # Create formatter
-    formatter = logging.Formatter(
-        fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
+    formatter = _JSON_FORMATTER if json_format else _TEXT_FORMATTER
     
     # Console handler
     console_handler = logging.StreamHandler()
-    console_handler.setLevel(getattr(logging, log_level.upper()))
+    console_handler.setLevel(level)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    handlers = [console_handler]
     
     # File handler (if specified)
     if log_file:
@@ -52,14 +178,40 @@ def setup_logging(log_level: str = "INFO",
             os.makedirs(log_dir)
         
         # Rotating file handler
-        file_handler = logging.handlers.RotatingFileHandler(
+        file_handler = _FastRotatingFileHandler(
             log_file,
             maxBytes=max_file_size,
             backupCount=backup_count
         )
-        file_handler.setLevel(getattr(logging, log_level.upper()))
+        file_handler.setLevel(level)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        
+        # Buffer file writes; errors are written through immediately
+        memory_handler = logging.handlers.MemoryHandler(
+            capacity=_FILE_BUFFER_CAPACITY,
+            flushLevel=logging.ERROR,
+            target=file_handler,
+            flushOnClose=True
+        )
+        memory_handler.setLevel(level)
+        handlers.append(memory_handler)
+        
+        global _flush_stop
+        _flush_stop = threading.Event()
+        threading.Thread(
+            target=_flush_periodically,
+            args=(memory_handler, _flush_stop),
+            name='log-flush',
+            daemon=True
+        ).start()
+    
+    # Route records through a queue to the handlers on a background thread
+    global _listener
+    log_queue = queue.Queue(-1)
+    logger.addHandler(_QueueHandler(log_queue))
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    _configured = config
     
     # Prevent propagation to root logger
     logger.propagate = False
@@ -67,6 +219,7 @@ def setup_logging(log_level: str = "INFO",
     logger.info("Logging configured successfully")
     return logger
 
+@functools.lru_cache(maxsize=None)
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance with the specified name
@@ -77,7 +230,7 @@ def get_logger(name: str) -> logging.Logger:
     Returns:
         Logger instance
     """
-    return logging.getLogger(f'bitcoin_model.{name}')
+    return logging.getLogger('bitcoin_model.' + name)
 
 class LoggingMixin:
     """Mixin class to add logging capabilities to other classes"""
@@ -88,10 +241,19 @@ class LoggingMixin:
     
     def log_method_call(self, method_name: str, **kwargs):
         """Log a method call with parameters"""
+        # Parameter reprs can be expensive (arrays, DataFrames); skip them
+        # entirely unless DEBUG output is enabled
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
         params = ', '.join(f'{k}={v}' for k, v in kwargs.items())
-        self.logger.debug(f"Calling {method_name}({params})")
+        self.logger.debug("Calling %s(%s)", method_name, params)
     
     def log_error(self, error: Exception, context: str = ""):
         """Log an error with context"""
+        if not self.logger.isEnabledFor(logging.ERROR):
+            return
         context_str = f" in {context}" if context else ""
-        self.logger.error(f"Error{context_str}: {str(error)}", exc_info=True)
\ No newline at end of file
+        # Attach the error's own traceback; an error that was never raised has
+        # none, so there is nothing to format
+        exc_info = error if error.__traceback__ is not None else False
+        self.logger.error("Error%s: %s", context_str, error, exc_info=exc_info)
\ No newline at end of file
@@ -0,0 +1,30 @@
+"""
+Time utilities for Bitcoin Strategic Investment Model
+"""
+
+import time
+from datetime import datetime
+
+# (epoch second, ISO string) for the most recently formatted second
+_iso_cache = (None, '')
+
+def now_iso() -> str:
+    """
+    Get the current local time as an ISO 8601 string
+    
+    The formatted string is cached per wall-clock second, so metadata
+    stamped many times within one analysis or health check only formats once.
+    
+    Returns:
+        Current time in ISO format at second resolution
+    """
+    global _iso_cache
+    
+    second = int(time.time())
+    cached_second, cached_iso = _iso_cache
+    if second == cached_second:
+        return cached_iso
+    
+    iso = datetime.fromtimestamp(second).isoformat()
+    _iso_cache = (second, iso)
+    return iso
@@ -82,12 +82,13 @@ def main():
     print("\n🎯 Strongest Signal Analysis")
     strongest = model.get_strongest_signal(portfolio_value)
     
-    if strongest.get('signals', {}).get('buy_signal', False):
+    strongest_signals = strongest.get('signals') or {}
+    if strongest_signals.get('buy_signal', False):
         print(f"✅ STRONG BUY SIGNAL DETECTED!")
         print(f"Scenario: {strongest.get('scenario_name', 'Unknown')}")
-        print(f"Signal Strength: {strongest['signals']['combined_score']:.3f}")
+        print(f"Signal Strength: {strongest_signals['combined_score']:.3f}")
         
-        trade_plan = strongest.get('trade_plan', {})
+        trade_plan = strongest.get('trade_plan') or {}
         print(f"\n📋 Recommended Action:")
         print(f"  Position Size: {trade_plan.get('position_size', 0)*100:.1f}%")
         print(f"  Position Value: ${trade_plan.get('position_value', 0):,.2f}")
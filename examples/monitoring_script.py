@@ -4,25 +4,32 @@ Continuous monitoring script for Bitcoin Strategic Investment Model
 
 import os
 import time
-import schedule
+import heapq
 import logging
 from datetime import datetime
+from types import MappingProxyType
 from dotenv import load_dotenv
 
 from bitcoin_model import BitcoinMacroModel
+from bitcoin_model.utils.logging_config import JsonFormatter
 
-# Setup logging
+# Setup logging (the log file gets one JSON object per line)
+file_handler = logging.FileHandler('bsi_monitor.log')
+file_handler.setFormatter(JsonFormatter())
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler('bsi_monitor.log'),
+        file_handler,
         logging.StreamHandler()
     ]
 )
 
 logger = logging.getLogger(__name__)
 
+# Shared read-only default for missing result sections
+_EMPTY = MappingProxyType({})
+
 class BSIMonitor:
     """Continuous monitoring for BSI signals"""
     
@@ -56,7 +63,7 @@ class BSIMonitor:
                     logger.error(f"❌ {scenario_name}: {result['error']}")
                     continue
                 
-                signals = result.get('signals', {})
+                signals = result.get('signals') or _EMPTY
                 buy_signal = signals.get('buy_signal', False)
                 score = signals.get('combined_score', 0.0)
                 
@@ -64,7 +71,7 @@ class BSIMonitor:
                 logger.info(f"{status} - {scenario_name}: Score {score:.3f}")
                 
                 if buy_signal:
-                    trade_plan = result.get('trade_plan', {})
+                    trade_plan = result.get('trade_plan') or _EMPTY
                     position_size = trade_plan.get('position_size', 0) * 100
                     position_value = trade_plan.get('position_value', 0)
                     
@@ -76,10 +83,11 @@ class BSIMonitor:
             
             # Get strongest signal
             strongest = self.model.get_strongest_signal(self.portfolio_value)
-            if strongest.get('signals', {}).get('buy_signal', False):
+            strongest_signals = strongest.get('signals') or _EMPTY
+            if strongest_signals.get('buy_signal', False):
                 logger.info("🎯 STRONGEST SIGNAL ACTIVE!")
                 logger.info(f"   Scenario: {strongest.get('scenario_name')}")
-                logger.info(f"   Score: {strongest['signals']['combined_score']:.3f}")
+                logger.info(f"   Score: {strongest_signals['combined_score']:.3f}")
         
         except Exception as e:
             logger.error(f"Error checking signals: {str(e)}")
@@ -122,38 +130,40 @@ class BSIMonitor:
         """
         scenario_name = signal_result.get('scenario_name', 'Unknown')
         score = signal_result['signals']['combined_score']
-        trade_plan = signal_result.get('trade_plan', {})
+        trade_plan = signal_result.get('trade_plan') or _EMPTY
         
-        message = f"""
-🚨 BSI BUY SIGNAL ALERT 🚨
-
-Scenario: {scenario_name}
-Signal Strength: {score:.3f}
-Position Size: {trade_plan.get('position_size', 0)*100:.1f}%
-Position Value: ${trade_plan.get('position_value', 0):,.2f}
-
-Rationale: {trade_plan.get('rationale', 'N/A')}
-
-Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-        """
+        alert = {
+            'event': 'bsi_buy_signal',
+            'scenario': scenario_name,
+            'score': score,
+            'position_size_pct': trade_plan.get('position_size', 0) * 100,
+            'position_value': trade_plan.get('position_value', 0),
+            'rationale': trade_plan.get('rationale', 'N/A'),
+            'timestamp': datetime.now().isoformat(timespec='seconds')
+        }
         
         # TODO: Implement your notification system
-        logger.info(f"ALERT: {message}")
+        # Logged as a single line; the JSON log file gets the alert fields
+        logger.warning("ALERT: BSI buy signal - %s (score %.3f)", scenario_name, score,
+                       extra={'extra_fields': alert})
         
-        # Example integrations:
-        # self.send_email(message)
-        # self.send_slack(message)
-        # self.send_discord(message)
+        # Example integrations, each rendering the alert payload for its channel:
+        # self.send_email(alert)
+        # self.send_slack(alert)
+        # self.send_discord(alert)
     
     def run_scheduler(self):
         """Run the monitoring scheduler"""
         logger.info("📅 Starting BSI monitoring scheduler...")
         
-        # Schedule signal checks every 30 minutes
-        schedule.every(30).minutes.do(self.check_signals)
-        
-        # Schedule health checks every 6 hours
-        schedule.every(6).hours.do(self.health_check)
+        # Jobs as (next run on the monotonic clock, insertion order, period, job),
+        # kept in a heap so the loop sleeps exactly until the next one is due
+        start = time.monotonic()
+        jobs = [
+            (start + 30 * 60, 0, 30 * 60, self.check_signals),    # every 30 minutes
+            (start + 6 * 3600, 1, 6 * 3600, self.health_check)    # every 6 hours
+        ]
+        heapq.heapify(jobs)
         
         # Run initial checks
         self.health_check()
@@ -162,8 +172,10 @@ Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
         # Main loop
         try:
             while True:
-                schedule.run_pending()
-                time.sleep(60)  # Check every minute
+                deadline, order, period, job = jobs[0]
+                time.sleep(max(0.0, deadline - time.monotonic()))
+                heapq.heapreplace(jobs, (deadline + period, order, period, job))
+                job()
         except KeyboardInterrupt:
             logger.info("👋 Monitoring stopped by user")
         except Exception as e:
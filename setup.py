@@ -38,6 +38,7 @@ setup(
         "dev": [
             "pytest>=7.4.0",
             "pytest-asyncio>=0.21.0",
+            "pytest-xdist>=3.3.0",
             "black>=23.0.0",
             "flake8>=6.0.0",
         ]
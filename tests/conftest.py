@@ -0,0 +1,120 @@
+"""
+Shared fixtures for the Bitcoin Strategic Investment Model tests
+
+Session and module scoped fixtures are built independently in each
+pytest-xdist worker, so they hold no state shared across processes.
+"""
+
+import copy
+import json
+from pathlib import Path
+from types import MappingProxyType
+from unittest.mock import Mock, patch
+
+import aiohttp
+import pytest
+import requests
+
+from bitcoin_model import BitcoinMacroModel
+from bitcoin_model.models.fed_pivot import FedPivotModel
+from bitcoin_model.config.settings import Settings
+from bitcoin_model.data_providers.crypto_data import MockOnChainDataProvider
+
+# Recorded model outputs replayed by the tests; regenerate with --record
+FIXTURES_DIR = Path(__file__).parent / 'fixtures'
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--record", action="store_true", default=False,
+        help="re-run the recorded model analyses and rewrite tests/fixtures"
+    )
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "smoke: import-level checks; deselect with -m 'not smoke' for quick runs"
+    )
+
+@pytest.fixture(autouse=True, scope="session")
+def _no_network():
+    """Fail fast on any real requests or aiohttp call, so no test can silently use the network"""
+    blocked = RuntimeError("network disabled in unit tests")
+    with patch.object(requests.Session, 'send', side_effect=blocked), \
+         patch.object(aiohttp.ClientSession, '_request', side_effect=blocked):
+        yield
+
+@pytest.fixture(scope="session")
+def settings():
+    """Settings instance shared by the whole session (read-only in tests)"""
+    return Settings()
+
+@pytest.fixture
+def frozen_now():
+    """Pin the timestamp BitcoinMacroModel stamps on results, and return it"""
+    timestamp = '2024-01-01T00:00:00'
+    with patch('bitcoin_model.core.now_iso', return_value=timestamp):
+        yield timestamp
+
+# Built once and read-only, so no test can leak changes into another
+_MOCK_API_KEYS = MappingProxyType({
+    'fred': 'test_fred_key',
+    'glassnode': 'test_glassnode_key',
+    'cryptoquant': 'test_cryptoquant_key',
+    'coingecko': 'test_coingecko_key'
+})
+
+@pytest.fixture(scope="session")
+def mock_api_keys():
+    """Mock API keys for testing"""
+    return _MOCK_API_KEYS
+
+@pytest.fixture(scope="module")
+def macro_model(mock_api_keys):
+    """BitcoinMacroModel shared by a test module; patch it rather than mutate it"""
+    return BitcoinMacroModel(mock_api_keys)
+
+@pytest.fixture(scope="module")
+def fed_model(mock_api_keys):
+    """FedPivotModel shared by a test module"""
+    return FedPivotModel(mock_api_keys)
+
+@pytest.fixture(scope="session")
+def exchange_reserves():
+    """Exchange reserves reported by the mock on-chain provider"""
+    return MockOnChainDataProvider().get_exchange_reserves()
+
+def _record_fed_analyze(path: Path) -> dict:
+    """Run FedPivotModel.analyze against stubbed providers and save the result"""
+    fred_client = Mock()
+    fred_client.get_current_fed_rate.return_value = 0.5
+    fred_client.detect_fed_pivot.return_value = {
+        'pivot_detected': True,
+        'direction': 'cutting',
+        'magnitude': 1.0,
+        'trend_change': -0.75
+    }
+    fred_client.get_m2_growth_rate.return_value = 0.08
+    
+    model = FedPivotModel(_MOCK_API_KEYS, fred_client=fred_client, crypto_provider=Mock(),
+                          onchain_provider=MockOnChainDataProvider())
+    result = model.analyze(100000)
+    
+    path.parent.mkdir(exist_ok=True)
+    path.write_text(json.dumps(result, indent=2) + "\n")
+    return result
+
+@pytest.fixture(scope="session")
+def _fed_analyze_recording(request):
+    """Recorded FedPivotModel.analyze result (low rates, cutting, low reserves)"""
+    path = FIXTURES_DIR / 'fed_analyze.json'
+    # Only an explicit --record writes the file, so parallel workers never race on it
+    if request.config.getoption("--record"):
+        return _record_fed_analyze(path)
+    if not path.exists():
+        pytest.fail(f"Missing recorded fixture {path}; regenerate it with 'pytest --record'",
+                    pytrace=False)
+    return json.loads(path.read_text())
+
+@pytest.fixture
+def fed_analyze_result(_fed_analyze_recording):
+    """Fresh copy of the recorded result, since the model annotates results in place"""
+    return copy.deepcopy(_fed_analyze_recording)
@@ -2,54 +2,106 @@
 Basic tests for Bitcoin Strategic Investment Model
 """
 
+import asyncio
+import dataclasses
+import json
+import logging
+import operator
+import queue
+import sys
+import time
+from contextlib import ExitStack
+from types import MappingProxyType
+from unittest.mock import AsyncMock, Mock, patch
+
+import numpy as np
 import pytest
-import os
-from unittest.mock import Mock, patch
-from datetime import datetime
 
 from bitcoin_model import BitcoinMacroModel
 from bitcoin_model.models.fed_pivot import FedPivotModel
 from bitcoin_model.models.m2_miner import M2MinerModel
-from bitcoin_model.config.settings import Settings
+from bitcoin_model.data_providers.fred_client import FREDClient
+from bitcoin_model.data_providers.crypto_data import CoinGeckoClient
+from bitcoin_model.exchange_integration.automated_trader import AutomatedTrader, LOOP_BACKOFF_BASE
+from bitcoin_model.exchange_integration.trading_config import SafetyManager, TradingConfig
+from bitcoin_model.utils.error_handling import (
+    DataProviderError, ErrorTracker, handle_api_error,
+    validate_percentage, validate_positive_number
+)
+from bitcoin_model.utils.logging_config import JsonFormatter, _QueueHandler
+
+# Read-only model inputs shared by the tests; a model that mutated its
+# input would fail loudly here instead of leaking state between tests
+FED_DATA_LOW_RATE_CUTTING = MappingProxyType({
+    'fed_funds_rate': 0.5,
+    'pivot_detected': True,
+    'pivot_direction': 'cutting',
+    'pivot_magnitude': 1.0
+})
+
+FED_DATA_HIGH_RATE_NEUTRAL = MappingProxyType({
+    'fed_funds_rate': 6.0,
+    'pivot_detected': False,
+    'pivot_direction': 'neutral',
+    'pivot_magnitude': 0.0
+})
+
+FED_DATA_CUTTING = MappingProxyType({
+    'fed_funds_rate': 1.0,
+    'pivot_detected': True,
+    'pivot_direction': 'cutting'
+})
+
+RESERVE_DATA_LOW = MappingProxyType({
+    'exchange_reserves': 2.3e6,  # Very low reserves
+    'reserve_score': 1.0
+})
 
 class TestSettings:
     """Test configuration settings"""
     
-    def test_settings_initialization(self):
+    def test_settings_initialization(self, settings):
         """Test that settings initialize correctly"""
-        settings = Settings()
-        
         assert settings.POSITION_LIMITS is not None
-        assert 'conservative' in settings.POSITION_LIMITS
-        assert 'moderate' in settings.POSITION_LIMITS
-        assert 'aggressive' in settings.POSITION_LIMITS
+        assert {'conservative', 'moderate', 'aggressive'} <= settings.POSITION_LIMITS.keys()
         
-    def test_position_limits(self):
+    @pytest.mark.parametrize("profile,base,maximum", [
+        ('conservative', 0.03, 0.10),
+        ('moderate', 0.05, 0.15),
+    ])
+    def test_position_limits(self, settings, profile, base, maximum):
         """Test position limit retrieval"""
-        settings = Settings()
-        
-        conservative = settings.get_position_limits('conservative')
-        assert conservative['base'] == 0.03
-        assert conservative['max'] == 0.10
-        
-        moderate = settings.get_position_limits('moderate')
-        assert moderate['base'] == 0.05
-        assert moderate['max'] == 0.15
+        limits = settings.get_position_limits(profile)
+        assert limits['base'] == base
+        assert limits['max'] == maximum
     
-    def test_signal_thresholds(self):
+    def test_signal_thresholds(self, settings):
         """Test signal threshold retrieval"""
-        settings = Settings()
-        
         threshold1 = settings.get_signal_threshold(1)
         threshold2 = settings.get_signal_threshold(2)
         
         assert threshold1 == 0.70
         assert threshold2 == 0.75
+        assert settings.get_signal_threshold(np.int64(2)) == 0.75
+        
+        # Unknown scenarios, including non-integers, fall back to the default
+        for scenario in (0, 3, None, '1', 1.5):
+            assert settings.get_signal_threshold(scenario) == 0.7
+    
+    def test_threshold_classification(self, settings):
+        """Test threshold classification matches the documented boundaries"""
+        assert settings.classify_exchange_reserves(2.3e6) == 'critical_low'
+        assert settings.classify_exchange_reserves(2.8e6) == 'normal'
+        assert settings.classify_exchange_reserves(3.1e6) == 'critical_high'
+        assert settings.classify_m2_growth(-0.01) == 'contraction'
+        assert settings.classify_m2_growth(0.10) == 'strong_expansion'
+        assert settings.classify_fed_rate(1.0) == 'low'
+        assert settings.classify_fed_rate(5.0) == 'high'
+        assert settings.classify_signal_strength(0.39) == 'weak'
+        assert settings.classify_signal_strength(0.8) == 'very_strong'
     
-    def test_config_validation(self):
+    def test_config_validation(self, settings):
         """Test configuration validation"""
-        settings = Settings()
-        
         validation = settings.validate_config()
         assert validation['valid'] is True
         assert len(validation['issues']) == 0
@@ -58,157 +110,117 @@ class TestBitcoinMacroModel:
     """Test main BitcoinMacroModel class"""
     
     @pytest.fixture
-    def mock_api_keys(self):
-        """Mock API keys for testing"""
-        return {
-            'fred': 'test_fred_key',
-            'glassnode': 'test_glassnode_key',
-            'cryptoquant': 'test_cryptoquant_key',
-            'coingecko': 'test_coingecko_key'
-        }
+    def mock_analyze(self, macro_model):
+        """Replace each scenario's analyze on the shared model, restoring it afterwards"""
+        # Scenario models are fully slotted, so patch the class: a plain Mock class
+        # attribute does not bind, and is called without self
+        with ExitStack() as stack:
+            yield {
+                scenario_id: stack.enter_context(patch.object(
+                    type(scenario), 'analyze', Mock(spec=type(scenario).analyze)))
+                for scenario_id, scenario in macro_model.scenarios.items()
+            }
     
-    def test_model_initialization(self, mock_api_keys):
+    def test_model_initialization(self, macro_model, mock_api_keys):
         """Test model initialization"""
-        model = BitcoinMacroModel(mock_api_keys)
+        model = macro_model
         
         assert model.api_keys == mock_api_keys
         assert len(model.scenarios) == 2
         assert 1 in model.scenarios
         assert 2 in model.scenarios
-        assert isinstance(model.scenarios[1], FedPivotModel)
-        assert isinstance(model.scenarios[2], M2MinerModel)
+        assert type(model.scenarios[1]) is FedPivotModel
+        assert type(model.scenarios[2]) is M2MinerModel
+        assert model.scenarios[1].fred_client is model.scenarios[2].fred_client
     
-    def test_model_initialization_without_keys(self):
+    def test_model_initialization_without_keys(self, monkeypatch):
         """Test model initialization without API keys"""
-        with patch.dict(os.environ, {
-            'FRED_API_KEY': 'env_fred_key',
-            'GLASSNODE_API_KEY': 'env_glassnode_key'
-        }):
-            model = BitcoinMacroModel()
-            
-            assert model.api_keys['fred'] == 'env_fred_key'
-            assert model.api_keys['glassnode'] == 'env_glassnode_key'
+        monkeypatch.setenv('FRED_API_KEY', 'env_fred_key')
+        monkeypatch.setenv('GLASSNODE_API_KEY', 'env_glassnode_key')
+        
+        model = BitcoinMacroModel()
+        
+        assert model.api_keys['fred'] == 'env_fred_key'
+        assert model.api_keys['glassnode'] == 'env_glassnode_key'
     
-    @patch('bitcoin_model.models.fed_pivot.FedPivotModel.analyze')
-    def test_run_analysis_scenario_1(self, mock_analyze, mock_api_keys):
+    def test_run_analysis_scenario_1(self, mock_analyze, macro_model, fed_analyze_result,
+                                     frozen_now):
         """Test running analysis for scenario 1"""
-        mock_result = {
-            'scenario': 1,
-            'signals': {'buy_signal': True, 'combined_score': 0.8},
-            'trade_plan': {'action': 'buy'}
-        }
-        mock_analyze.return_value = mock_result
+        mock_analyze[1].return_value = fed_analyze_result
         
-        model = BitcoinMacroModel(mock_api_keys)
-        result = model.run_analysis(scenario=1, portfolio_value=100000)
+        result = macro_model.run_analysis(scenario=1, portfolio_value=100000)
         
-        mock_analyze.assert_called_once_with(100000, None)
+        mock_analyze[1].assert_called_once_with(100000, None)
         assert result['scenario'] == 1
-        assert 'timestamp' in result
+        assert result['signals']['buy_signal'] is True
+        assert result['trade_plan']['action'] == 'buy'
+        assert result['timestamp'] == frozen_now
         assert 'portfolio_value' in result
     
-    def test_run_analysis_invalid_scenario(self, mock_api_keys):
+    def test_run_analysis_invalid_scenario(self, macro_model):
         """Test running analysis with invalid scenario"""
-        model = BitcoinMacroModel(mock_api_keys)
-        
         with pytest.raises(ValueError, match="Unknown scenario"):
-            model.run_analysis(scenario=99)
+            macro_model.run_analysis(scenario=99)
     
-    @patch('bitcoin_model.models.fed_pivot.FedPivotModel.analyze')
-    @patch('bitcoin_model.models.m2_miner.M2MinerModel.analyze')
-    def test_get_all_signals(self, mock_m2_analyze, mock_fed_analyze, mock_api_keys):
-        """Test getting all signals"""
-        mock_fed_result = {
+    @pytest.fixture
+    def mocked_scenarios(self, mock_analyze, macro_model):
+        """Shared model whose scenarios return fixed results (only scenario 2 signals a buy)"""
+        # Fresh dicts per test, since the model annotates results in place
+        mock_analyze[1].return_value = {
             'scenario': 1,
             'signals': {'buy_signal': False, 'combined_score': 0.5}
         }
-        mock_m2_result = {
+        mock_analyze[2].return_value = {
             'scenario': 2,
             'signals': {'buy_signal': True, 'combined_score': 0.8}
         }
-        
-        mock_fed_analyze.return_value = mock_fed_result
-        mock_m2_analyze.return_value = mock_m2_result
-        
-        model = BitcoinMacroModel(mock_api_keys)
-        results = model.get_all_signals(portfolio_value=100000)
+        return macro_model
+    
+    def test_get_all_signals(self, mocked_scenarios):
+        """Test getting all signals"""
+        results = mocked_scenarios.get_all_signals(portfolio_value=100000)
         
         assert 'scenario_1' in results
         assert 'scenario_2' in results
         assert results['scenario_1']['scenario'] == 1
         assert results['scenario_2']['scenario'] == 2
     
-    @patch('bitcoin_model.models.fed_pivot.FedPivotModel.analyze')
-    @patch('bitcoin_model.models.m2_miner.M2MinerModel.analyze')
-    def test_get_strongest_signal(self, mock_m2_analyze, mock_fed_analyze, mock_api_keys):
+    def test_get_strongest_signal(self, mocked_scenarios):
         """Test getting strongest signal"""
-        mock_fed_result = {
-            'scenario': 1,
-            'signals': {'buy_signal': False, 'combined_score': 0.5}
-        }
-        mock_m2_result = {
-            'scenario': 2,
-            'signals': {'buy_signal': True, 'combined_score': 0.8}
-        }
-        
-        mock_fed_analyze.return_value = mock_fed_result
-        mock_m2_analyze.return_value = mock_m2_result
-        
-        model = BitcoinMacroModel(mock_api_keys)
-        strongest = model.get_strongest_signal(portfolio_value=100000)
+        strongest = mocked_scenarios.get_strongest_signal(portfolio_value=100000)
         
         assert strongest['scenario'] == 2
         assert strongest['signals']['combined_score'] == 0.8
 
+    def test_health_check_timeout(self, macro_model):
+        """Test a slow scenario health check is reported as timed out"""
+        slow_check = Mock(side_effect=lambda: time.sleep(1) or {'status': 'healthy'})
+        with patch.object(type(macro_model.scenarios[1]), 'health_check', slow_check), \
+             patch.object(type(macro_model.scenarios[2]), 'health_check',
+                          Mock(return_value={'status': 'healthy'})):
+            health = macro_model.health_check(timeout=0.1)
+        
+        assert health['components']['scenario_1']['status'] == 'timeout'
+        assert health['components']['scenario_2']['status'] == 'healthy'
+        assert health['overall_status'] == 'degraded'
+
 class TestFedPivotModel:
     """Test Fed Pivot Model"""
     
-    @pytest.fixture
-    def mock_api_keys(self):
-        return {'fred': 'test_key'}
-    
-    def test_fed_score_calculation(self, mock_api_keys):
+    @pytest.mark.parametrize("fed_data,compare,bound", [
+        # Should be high for low rates + cuts
+        pytest.param(FED_DATA_LOW_RATE_CUTTING, operator.gt, 0.8, id='low_rate_cutting'),
+        # Should be low for high rates
+        pytest.param(FED_DATA_HIGH_RATE_NEUTRAL, operator.lt, 0.3, id='high_rate_neutral'),
+    ])
+    def test_fed_score_calculation(self, fed_model, fed_data, compare, bound):
         """Test Fed score calculation"""
-        model = FedPivotModel(mock_api_keys)
-        
-        # Test low rate scenario
-        fed_data_low = {
-            'fed_funds_rate': 0.5,
-            'pivot_detected': True,
-            'pivot_direction': 'cutting',
-            'pivot_magnitude': 1.0
-        }
-        
-        score_low = model.calculate_fed_score(fed_data_low)
-        assert score_low > 0.8  # Should be high for low rates + cuts
-        
-        # Test high rate scenario
-        fed_data_high = {
-            'fed_funds_rate': 6.0,
-            'pivot_detected': False,
-            'pivot_direction': 'neutral',
-            'pivot_magnitude': 0.0
-        }
-        
-        score_high = model.calculate_fed_score(fed_data_high)
-        assert score_high < 0.3  # Should be low for high rates
+        score = fed_model.calculate_fed_score(fed_data)
+        assert compare(score, bound)
     
-    def test_signal_strength_calculation(self, mock_api_keys):
+    def test_signal_strength_calculation(self, fed_model):
         """Test signal strength calculation"""
-        model = FedPivotModel(mock_api_keys)
-        
-        fed_data = {
-            'fed_funds_rate': 1.0,
-            'pivot_detected': True,
-            'pivot_direction': 'cutting'
-        }
-        
-        reserve_data = {
-            'exchange_reserves': 2.3e6,  # Very low reserves
-            'reserve_score': 1.0
-        }
-        
-        signals = model.calculate_signal_strength(fed_data, reserve_data)
+        signals = fed_model.calculate_signal_strength(FED_DATA_CUTTING, RESERVE_DATA_LOW)
         
         assert 'fed_score' in signals
         assert 'reserve_score' in signals
@@ -216,31 +228,245 @@ class TestFedPivotModel:
         assert 'buy_signal' in signals
         assert signals['combined_score'] > 0.7  # Should trigger buy signal
 
+class TestM2MinerModel:
+    """Test M2 Miner Model"""
+    
+    def test_m2_growth_and_acceleration(self):
+        """Test growth is derived from one M2 fetch"""
+        model = M2MinerModel({'fred': 'test_key'})
+        model.fred_client = Mock()
+        model.fred_client.get_m2_values.return_value = np.arange(100.0, 118.0)
+        
+        m2_data = model.get_m2_data()
+        
+        assert m2_data['m2_growth_rate'] == pytest.approx(12 / 105)
+        assert m2_data['m2_acceleration'] is None  # Needs 24 observations
+        model.fred_client.get_m2_values.assert_called_once()
+    
+    def test_m2_acceleration_adjusts_score(self):
+        """Test accelerating M2 growth over two years of data raises the M2 score"""
+        model = M2MinerModel({'fred': 'test_key'})
+        model.fred_client = Mock()
+        # YoY growth of 4%, 5% and 7% over the last three months
+        model.fred_client.get_m2_values.return_value = np.array([100.0] * 21 + [104.0, 105.0, 107.0])
+        
+        m2_data = model.get_m2_data()
+        
+        assert m2_data['growth_level'] == 'normal_expansion'
+        assert m2_data['m2_acceleration'] == pytest.approx(0.03)
+        assert model.calculate_m2_score(m2_data) == pytest.approx(0.5 + 0.15)
+        assert model.calculate_m2_score(dict(m2_data, m2_acceleration=None)) == pytest.approx(0.5)
+    
+    def test_analyze_result_is_flat(self):
+        """Test analyze_result flattens the nested analysis result"""
+        model = M2MinerModel({'fred': 'test_key'})
+        model.fred_client = Mock()
+        model.fred_client.get_m2_values.return_value = np.arange(100.0, 118.0)
+        
+        result = model.analyze_result(portfolio_value=100000)
+        row = result.to_dict()
+        
+        assert row['scenario'] == 2
+        assert row['combined_score'] == result.combined_score
+        assert all(not isinstance(value, dict) for value in row.values())
+
 class TestDataProviders:
     """Test data provider functionality"""
     
     def test_fred_client_initialization(self):
         """Test FRED client initialization"""
-        from bitcoin_model.data_providers.fred_client import FREDClient
+        # No HTTP session is needed to check the configuration
+        with patch('bitcoin_model.data_providers.fred_client.get_shared_session') as get_session:
+            client = FREDClient('test_key')
         
-        client = FREDClient('test_key')
         assert client.api_key == 'test_key'
         assert client.base_url == "https://api.stlouisfed.org/fred"
+        assert client._session is get_session.return_value
     
     def test_crypto_data_provider_initialization(self):
         """Test crypto data provider initialization"""
-        from bitcoin_model.data_providers.crypto_data import CoinGeckoClient, MockOnChainDataProvider
+        with patch('bitcoin_model.data_providers.crypto_data.get_shared_session') as get_session:
+            coingecko = CoinGeckoClient('test_key')
         
-        coingecko = CoinGeckoClient('test_key')
         assert coingecko.api_key == 'test_key'
+        assert coingecko._session is get_session.return_value
+    
+    def test_mock_onchain_exchange_reserves(self, exchange_reserves):
+        """Test the mock on-chain provider reports exchange reserves"""
+        assert exchange_reserves is not None
+        assert exchange_reserves > 0
+
+    def test_coingecko_market_data_single_request(self):
+        """Test price and market data share one coins/markets request"""
+        coingecko = CoinGeckoClient('test_key')
+        response = Mock()
+        response.content = json.dumps([{
+            'current_price': 65000.0,
+            'market_cap': 1.28e12,
+            'total_volume': 3.1e10,
+            'price_change_percentage_24h': 1.5,
+            'price_change_percentage_7d_in_currency': -2.0,
+            'price_change_percentage_30d_in_currency': 8.0,
+            'market_cap_rank': 1
+        }])
+        coingecko._session = Mock()
+        coingecko._session.get.return_value = response
+        
+        market_data = coingecko.get_bitcoin_market_data()
+        assert market_data['price_usd'] == 65000.0
+        assert market_data['price_change_7d'] == -2.0
+        assert coingecko.get_bitcoin_price() == 65000.0
+        coingecko._session.get.assert_called_once()
+
+class TestErrorHandling:
+    """Test error handling utilities"""
+    
+    def test_error_tracker_is_bounded(self):
+        """Test the tracker keeps only recent records but counts every error"""
+        tracker = ErrorTracker(maxlen=5)
+        for i in range(12):
+            tracker.record_error(ValueError(str(i)), component='test')
+        
+        summary = tracker.get_error_summary()
+        assert summary['total_errors'] == 12
+        assert len(tracker.errors) == 5
+        assert [err['message'] for err in summary['recent_errors']] == ['7', '8', '9', '10', '11']
+    
+    def test_validate_arrays(self):
+        """Test validators accept arrays and reject any invalid element"""
+        assert validate_percentage(0.5) == 0.5
+        assert validate_percentage(np.array([0.0, 0.5, 1.0])).tolist() == [0.0, 0.5, 1.0]
+        assert validate_positive_number(np.array([1, 2])).dtype == np.float64
+        
+        with pytest.raises(ValueError):
+            validate_percentage(np.array([0.2, 1.5]))
+        with pytest.raises(ValueError):
+            validate_positive_number(np.array([1.0, 0.0]))
+    
+    def test_handle_api_error_long_message(self):
+        """Test classification of a long provider error payload"""
+        @handle_api_error
+        def fetch():
+            raise Exception("https://api.example.com/v1?q=" + "a%20" * 1000 + " Too Many Requests")
+        
+        with pytest.raises(DataProviderError, match="Rate limit error"):
+            fetch()
+
+class TestLogging:
+    """Test logging configuration"""
+    
+    def test_json_record_keeps_traceback_through_queue(self):
+        """Test a queued exception record is written with a separate traceback field"""
+        handler = _QueueHandler(queue.Queue())
+        try:
+            raise ValueError("bad value")
+        except ValueError as e:
+            record = logging.LogRecord('bitcoin_model', logging.ERROR, __file__, 0,
+                                       "Failed: %s", (e,), sys.exc_info())
+        
+        entry = json.loads(JsonFormatter().format(handler.prepare(record)))
+        
+        assert entry['msg'] == "Failed: bad value"
+        assert 'ValueError: bad value' in entry['exc']
+
+class TestSafetyManager:
+    """Test trading safety checks"""
+    
+    def test_unusual_movement_compares_previous_check(self):
+        """Test the price movement warning only looks at the move since the last check"""
+        manager = SafetyManager()
+        
+        # A gradual 12% rise over several checks is not an unusual movement
+        for price in (50000.0, 52000.0, 54000.0, 56000.0):
+            checks = manager.check_safety_conditions(100000, price)
+            assert checks['warnings'] == []
+        
+        checks = manager.check_safety_conditions(100000, 62000.0)
+        assert checks['warnings'] == ["Unusual price movement detected: 10.71%"]
+    
+    def test_price_window_stats(self):
+        """Test rolling volatility and drawdown over the checked prices"""
+        manager = SafetyManager()
+        assert manager.price_window_stats() == {'realized_volatility': 0.0, 'max_drawdown': 0.0}
+        
+        for price in (100.0, 110.0, 99.0, 105.0):
+            manager.check_safety_conditions(100000, price)
+        
+        stats = manager.price_window_stats()
+        returns = np.diff(np.log([100.0, 110.0, 99.0, 105.0]))
+        assert stats['realized_volatility'] == pytest.approx(np.std(returns))
+        assert stats['max_drawdown'] == pytest.approx(0.1)
+
+class TestAutomatedTrader:
+    """Test the automated trading loop"""
+    
+    def test_network_error_in_cycle_backs_off(self):
+        """Test a NetworkError from fetch_ticker inside a cycle drives the loop backoff"""
+        import ccxt.async_support as ccxt_async
+        
+        model = Mock()
+        model.health_check_async = AsyncMock(return_value={'overall_status': 'healthy'})
+        config = TradingConfig(exchange='binance', api_key='k', api_secret='s')
+        trader = AutomatedTrader(model, config)
+        
+        # Live mode, so prices come from the exchange (validation only allows dry runs)
+        trader.config = dataclasses.replace(config, dry_run=False)
+        trader.exchange = Mock()
+        trader.exchange.fetch_ticker = AsyncMock(side_effect=ccxt_async.NetworkError("connection reset"))
+        trader.exchange.fetch_balance = AsyncMock(return_value={'total': {'USDT': 1000.0}})
+        trader.exchange.close = AsyncMock()
+        trader._open_http_session = Mock()
+        trader._connect_exchange = AsyncMock()
+        trader._start_ticker_stream = Mock()
+        wait = trader._wait_for_wakeup = AsyncMock(side_effect=lambda *args: trader.stop())
+        
+        asyncio.run(trader.start())
+        
+        delay = wait.call_args.args[0]
+        assert LOOP_BACKOFF_BASE <= delay <= LOOP_BACKOFF_BASE * 1.1
+        trader.exchange.fetch_ticker.assert_called()
+    
+    def test_unacknowledged_order_resolved_from_exchange(self):
+        """Test a timed-out submission stays pending until the exchange reports its fill"""
+        import ccxt.async_support as ccxt_async
+        
+        config = TradingConfig(exchange='binance', api_key='k', api_secret='s')
+        trader = AutomatedTrader(Mock(), config)
+        trader.config = dataclasses.replace(config, dry_run=False, order_timeout=0)
+        trader.exchange = Mock()
+        trader.exchange.create_market_buy_order = AsyncMock(side_effect=asyncio.Event().wait)
+        
+        async def run():
+            ticket = await trader._place_order('buy', 0.01, asynchronous=True)
+            await asyncio.sleep(0)  # submission is in flight
+            
+            # Timed out: the local submission is cancelled but the order still counts
+            await trader._reap_pending_orders()
+            await asyncio.sleep(0)
+            assert trader._pending_amounts()[0] == pytest.approx(0.01)
+            
+            # An unanswered lookup keeps it pending
+            trader.exchange.fetch_order = AsyncMock(side_effect=ccxt_async.ExchangeError("busy"))
+            await trader._reap_pending_orders()
+            assert ticket['id'] in trader.pending_orders
+            
+            # The exchange reports the fill: it moves from pending into the position
+            trader.exchange.fetch_order = AsyncMock(
+                return_value={'id': 'x1', 'status': 'closed', 'filled': 0.01})
+            await trader._reap_pending_orders()
+            trader.exchange.fetch_order.assert_called_once_with(
+                ticket['id'], 'BTC/USDT', {'clientOrderId': ticket['id']})
+            _, _, params = trader.exchange.create_market_buy_order.call_args.args
+            assert params == {'clientOrderId': ticket['id']}
+        
+        asyncio.run(run())
         
-        mock_provider = MockOnChainDataProvider()
-        reserves = mock_provider.get_exchange_reserves()
-        assert reserves is not None
-        assert reserves > 0
+        assert not trader.pending_orders
+        assert trader.positions[0] == pytest.approx(0.01)
 
+@pytest.mark.smoke
 def test_import():
-    """Test that main imports work"""
+    """Test that main imports work (the package's lazy re-exports)"""
     from bitcoin_model import BitcoinMacroModel, FedPivotModel, M2MinerModel
     
     assert BitcoinMacroModel is not None